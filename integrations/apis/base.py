@@ -7,29 +7,67 @@ Provides base classes and utilities for all API integrations
 import os
 import json
 import time
+import atexit
+import asyncio
 import logging
-from abc import ABC, abstractmethod
+import functools
+import importlib
+import threading
+from abc import ABC
+from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, List, Optional, Union
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
-try:
-    import requests
-except ImportError:
-    requests = None
+# requests and aiohttp are imported on first use (see _lazy_requests /
+# _lazy_aiohttp) so importing the registry stays cheap
 
 try:
-    import aiohttp
+    import orjson
 except ImportError:
-    aiohttp = None
+    orjson = None
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the application; stay silent otherwise
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Transient statuses worth retrying; other 4xx responses are returned as-is
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+@functools.cache
+def _lazy_requests():
+    """Import requests on first use; None if it is not installed"""
+    try:
+        return importlib.import_module('requests')
+    except ImportError:
+        return None
+
 
+@functools.cache
+def _lazy_aiohttp():
+    """Import aiohttp on first use; None if it is not installed"""
+    try:
+        return importlib.import_module('aiohttp')
+    except ImportError:
+        return None
 
-@dataclass
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO 8601 string"""
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat(timespec='milliseconds')
+
+
+def _loads(content: bytes) -> Any:
+    """Parse a JSON body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+@dataclass(slots=True)
 class APIResponse:
     """Standardized API response wrapper"""
     success: bool
@@ -38,20 +76,26 @@ class APIResponse:
     error: Optional[str] = None
     headers: Dict[str, str] = field(default_factory=dict)
     elapsed_ms: float = 0
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = field(default_factory=_iso_now)
+
+    # Fields included in serialized output (headers are omitted)
+    _FIELDS = ('success', 'status_code', 'data', 'error', 'elapsed_ms', 'timestamp')
 
     def to_dict(self) -> dict:
-        return {
-            'success': self.success,
-            'status_code': self.status_code,
-            'data': self.data,
-            'error': self.error,
-            'elapsed_ms': self.elapsed_ms,
-            'timestamp': self.timestamp
-        }
+        return {k: getattr(self, k) for k in self._FIELDS}
+
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes, using orjson when available"""
+        if orjson is not None:
+            return orjson.dumps(
+                self,
+                option=orjson.OPT_PASSTHROUGH_DATACLASS,
+                default=APIResponse.to_dict
+            )
+        return json.dumps(self.to_dict()).encode('utf-8')
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheckResult:
     """Result of an endpoint health check"""
     endpoint: str
@@ -59,7 +103,50 @@ class HealthCheckResult:
     status_code: Optional[int] = None
     latency_ms: float = 0
     error: Optional[str] = None
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = field(default_factory=_iso_now)
+
+
+class _AsyncTransport:
+    """
+    Shared aiohttp session for async requests
+
+    The session is bound to the event loop it was created in, so it is
+    created lazily inside a running loop and recreated if the loop changes.
+    """
+
+    _session = None
+    _loop = None
+
+    @classmethod
+    def get_session(cls):
+        """Get the shared session for the running loop"""
+        loop = asyncio.get_running_loop()
+        if cls._session is None or cls._session.closed or cls._loop is not loop:
+            aiohttp = _lazy_aiohttp()
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30)
+            )
+            cls._loop = loop
+        return cls._session
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the shared session"""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+        cls._loop = None
+
+    @classmethod
+    def close_at_exit(cls) -> None:
+        """Close a session left open on an idle loop at interpreter exit"""
+        loop = cls._loop
+        if cls._session is None or loop is None or loop.is_closed() or loop.is_running():
+            return
+        loop.run_until_complete(cls.close())
+
+
+atexit.register(_AsyncTransport.close_at_exit)
 
 
 class BaseAPI(ABC):
@@ -77,6 +164,10 @@ class BaseAPI(ABC):
     name: str = "base"
     base_url: str = ""
     auth_type: str = "bearer"  # bearer, x-api-key, basic, oauth2
+    _health_endpoint: str = ""  # GET endpoint probed by health checks
+    _health_params: Optional[dict] = None
+    _health_ok_codes: tuple = (200,)  # Status codes that count as healthy
+    _HC_TTL: float = 1.0  # Seconds a health check result is reused
 
     def __init__(self,
                  api_key: Optional[str] = None,
@@ -89,13 +180,68 @@ class BaseAPI(ABC):
         self.api_key = api_key or os.getenv(env_var or '')
         if base_url:
             self.base_url = base_url
+        self._base = self.base_url.rstrip('/')
+        self._url_cache: Dict[str, str] = {}
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self._session = None
-
-    def _get_headers(self) -> Dict[str, str]:
-        """Get authentication headers"""
+        self._hc_cached: Optional[HealthCheckResult] = None
+        self._hc_ts = 0.0
+        self._hc_lock = threading.Lock()
+        self._static_headers = self._build_headers()
+
+    def _get_session(self):
+        """Get the pooled HTTP session, creating it on first use"""
+        if self._session is None:
+            from urllib3.util.retry import Retry
+
+            requests = _lazy_requests()
+            session = requests.Session()
+            session.headers.update(self._static_headers)
+            # max_retries counts attempts (as in _arequest); Retry counts
+            # retries after the first attempt
+            retry = Retry(
+                total=max(self.max_retries - 1, 0),
+                backoff_factor=self.retry_delay,
+                status_forcelist=_RETRY_STATUSES,
+                allowed_methods=frozenset(['GET', 'PUT', 'POST', 'PATCH', 'DELETE']),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=retry
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._session = session
+        return self._session
+
+    def _url(self, endpoint: str) -> str:
+        """Build the full URL for an endpoint, memoized per instance"""
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            if len(self._url_cache) >= 256:
+                self._url_cache.clear()
+            url = self._url_cache[endpoint] = f"{self._base}/{endpoint.lstrip('/')}"
+        return url
+
+    def close(self) -> None:
+        """Release pooled connections"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _build_headers(self) -> Dict[str, str]:
+        """Build authentication headers (computed once per instance)"""
         headers = {
             'Content-Type': 'application/json',
             'User-Agent': 'BlackRoad-Backup-Automator/1.0'
@@ -107,20 +253,29 @@ class BaseAPI(ABC):
             elif self.auth_type == 'x-api-key':
                 headers['x-api-key'] = self.api_key
             elif self.auth_type == 'basic':
-                import base64
-                encoded = base64.b64encode(self.api_key.encode()).decode()
+                encoded = b64encode(self.api_key.encode()).decode()
                 headers['Authorization'] = f'Basic {encoded}'
 
         return headers
 
+    def _get_headers(self) -> Dict[str, str]:
+        """Get authentication headers"""
+        return dict(self._static_headers)
+
     def _request(self,
                  method: str,
                  endpoint: str,
-                 data: Optional[dict] = None,
+                 data: Optional[Union[dict, list]] = None,
                  params: Optional[dict] = None,
-                 headers: Optional[dict] = None) -> APIResponse:
-        """Make an HTTP request with retry logic"""
+                 headers: Optional[dict] = None,
+                 raw: Optional[bytes] = None) -> APIResponse:
+        """
+        Make an HTTP request (retries are configured on the session)
+
+        `raw` sends bytes as an octet-stream body instead of JSON-encoding `data`.
+        """
 
+        requests = _lazy_requests()
         if requests is None:
             return APIResponse(
                 success=False,
@@ -128,51 +283,135 @@ class BaseAPI(ABC):
                 error="requests library not installed"
             )
 
-        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-        req_headers = {**self._get_headers(), **(headers or {})}
+        url = self._url(endpoint)
+        session = self._get_session()
+        if raw is not None:
+            headers = {**(headers or {}), 'Content-Type': 'application/octet-stream'}
+
+        # Retries and backoff for connection errors, 429 and 5xx are handled
+        # by the session adapter; this only translates the outcome
+        try:
+            start_time = time.monotonic()
+
+            # Auth headers live on the session; only overrides go per-request
+            response = session.request(
+                method=method.upper(),
+                url=url,
+                json=data,
+                data=raw,
+                params=params,
+                headers=headers,
+                timeout=self.timeout
+            )
+
+            elapsed_ms = (time.monotonic() - start_time) * 1000
+
+            # Only attempt JSON when the server says it is JSON
+            if 'json' in response.headers.get('Content-Type', ''):
+                try:
+                    response_data = _loads(response.content)
+                except ValueError:
+                    response_data = response.text
+            else:
+                response_data = response.text
+
+            return APIResponse(
+                success=response.ok,
+                status_code=response.status_code,
+                data=response_data,
+                headers=dict(response.headers),
+                elapsed_ms=elapsed_ms,
+                error=None if response.ok else str(response_data)
+            )
+
+        except requests.exceptions.Timeout:
+            error = "Request timed out"
+        except requests.exceptions.ConnectionError as e:
+            error = f"Connection error: {e}"
+        except Exception as e:
+            error = f"Request failed: {e}"
+
+        return APIResponse(
+            success=False,
+            status_code=0,
+            error=error
+        )
+
+    async def _arequest(self,
+                        method: str,
+                        endpoint: str,
+                        data: Optional[Union[dict, list]] = None,
+                        params: Optional[dict] = None,
+                        headers: Optional[dict] = None) -> APIResponse:
+        """Make an async HTTP request over the shared aiohttp session"""
+
+        aiohttp = _lazy_aiohttp()
+        if aiohttp is None:
+            return APIResponse(
+                success=False,
+                status_code=0,
+                error="aiohttp library not installed"
+            )
+
+        url = self._url(endpoint)
+        req_headers = self._static_headers if not headers else {**self._static_headers, **headers}
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
 
         last_error = None
         for attempt in range(self.max_retries):
+            retry_after = None
             try:
-                start_time = time.time()
+                start_time = time.monotonic()
 
-                response = requests.request(
-                    method=method.upper(),
-                    url=url,
+                session = _AsyncTransport.get_session()
+                async with session.request(
+                    method.upper(),
+                    url,
                     json=data,
                     params=params,
                     headers=req_headers,
-                    timeout=self.timeout
-                )
-
-                elapsed_ms = (time.time() - start_time) * 1000
-
-                try:
-                    response_data = response.json()
-                except:
-                    response_data = response.text
-
-                return APIResponse(
-                    success=response.ok,
-                    status_code=response.status_code,
-                    data=response_data,
-                    headers=dict(response.headers),
-                    elapsed_ms=elapsed_ms,
-                    error=None if response.ok else str(response_data)
-                )
-
-            except requests.exceptions.Timeout:
+                    timeout=timeout
+                ) as response:
+                    if 'json' in response.content_type:
+                        try:
+                            response_data = _loads(await response.read())
+                        except ValueError:
+                            response_data = await response.text(errors='replace')
+                    else:
+                        response_data = await response.text(errors='replace')
+
+                    elapsed_ms = (time.monotonic() - start_time) * 1000
+
+                    result = APIResponse(
+                        success=response.ok,
+                        status_code=response.status,
+                        data=response_data,
+                        headers=dict(response.headers),
+                        elapsed_ms=elapsed_ms,
+                        error=None if response.ok else str(response_data)
+                    )
+
+                    # Same policy as the sync adapter: only 429/5xx are retried
+                    if response.status not in _RETRY_STATUSES or attempt == self.max_retries - 1:
+                        return result
+                    last_error = result.error
+                    retry_after = response.headers.get('Retry-After')
+
+            except asyncio.TimeoutError:
                 last_error = "Request timed out"
-            except requests.exceptions.ConnectionError as e:
+            except aiohttp.ClientConnectionError as e:
                 last_error = f"Connection error: {e}"
             except Exception as e:
                 last_error = f"Request failed: {e}"
 
             # Exponential backoff
             if attempt < self.max_retries - 1:
-                sleep_time = self.retry_delay * (2 ** attempt)
+                if retry_after and retry_after.isdigit():
+                    sleep_time = float(retry_after)
+                else:
+                    sleep_time = self.retry_delay * (2 ** attempt)
                 logger.warning(f"Retry {attempt + 1}/{self.max_retries} after {sleep_time}s: {last_error}")
-                time.sleep(sleep_time)
+                await asyncio.sleep(sleep_time)
 
         return APIResponse(
             success=False,
@@ -200,14 +439,72 @@ class BaseAPI(ABC):
         """DELETE request"""
         return self._request('DELETE', endpoint)
 
-    @abstractmethod
+    def _health_result(self, response: APIResponse, start: float) -> HealthCheckResult:
+        """Build a HealthCheckResult from a probe response"""
+        healthy = response.status_code in self._health_ok_codes
+        return HealthCheckResult(
+            endpoint=f"{self._base}{self._health_endpoint}",
+            healthy=healthy,
+            status_code=response.status_code,
+            latency_ms=(time.monotonic() - start) * 1000,
+            error=None if healthy else response.error
+        )
+
     def health_check(self) -> HealthCheckResult:
         """Perform a health check on the API"""
-        pass
-
-    def is_healthy(self) -> bool:
+        start = time.monotonic()
+        response = self.get(self._health_endpoint, params=self._health_params)
+        return self._health_result(response, start)
+
+    async def ahealth_check(self) -> HealthCheckResult:
+        """
+        Async health check
+
+        Probes _health_endpoint over aiohttp. Subclasses with a custom
+        health_check (or without aiohttp installed) run it in a thread.
+        """
+        if type(self).health_check is not BaseAPI.health_check or _lazy_aiohttp() is None:
+            return await asyncio.to_thread(self.health_check)
+
+        start = time.monotonic()
+        response = await self._arequest('GET', self._health_endpoint, params=self._health_params)
+        return self._health_result(response, start)
+
+    def _fresh_health_result(self) -> Optional[HealthCheckResult]:
+        """Return the cached health check result if still within the TTL"""
+        if self._hc_cached and time.monotonic() - self._hc_ts < self._HC_TTL:
+            return self._hc_cached
+        return None
+
+    def _store_health_result(self, result: HealthCheckResult) -> HealthCheckResult:
+        self._hc_cached = result
+        self._hc_ts = time.monotonic()
+        return result
+
+    def cached_health_check(self, use_cache: bool = True) -> HealthCheckResult:
+        """
+        Health check shared by all callers within the TTL window
+
+        Concurrent callers wait on the lock and reuse the in-flight result
+        instead of each issuing a request. Pass use_cache=False to force a
+        fresh check.
+        """
+        with self._hc_lock:
+            cached = self._fresh_health_result() if use_cache else None
+            if cached:
+                return cached
+            return self._store_health_result(self.health_check())
+
+    async def acached_health_check(self, use_cache: bool = True) -> HealthCheckResult:
+        """Async counterpart of cached_health_check"""
+        cached = self._fresh_health_result() if use_cache else None
+        if cached:
+            return cached
+        return self._store_health_result(await self.ahealth_check())
+
+    def is_healthy(self, use_cache: bool = True) -> bool:
         """Quick health check returning boolean"""
-        return self.health_check().healthy
+        return self.cached_health_check(use_cache).healthy
 
 
 class CloudflareAPI(BaseAPI):
@@ -216,6 +513,7 @@ class CloudflareAPI(BaseAPI):
     name = "cloudflare"
     base_url = "https://api.cloudflare.com/client/v4"
     auth_type = "bearer"
+    _health_endpoint = "/user/tokens/verify"
 
     def __init__(self, api_key: Optional[str] = None):
         super().__init__(
@@ -224,83 +522,213 @@ class CloudflareAPI(BaseAPI):
         )
         self.account_id = os.getenv("CLOUDFLARE_ACCOUNT_ID")
 
-    def health_check(self) -> HealthCheckResult:
-        start = time.time()
-        response = self.get("/user/tokens/verify")
-        return HealthCheckResult(
-            endpoint=f"{self.base_url}/user/tokens/verify",
-            healthy=response.success,
-            status_code=response.status_code,
-            latency_ms=(time.time() - start) * 1000,
-            error=response.error
-        )
-
     def kv_get(self, namespace_id: str, key: str) -> APIResponse:
         """Get a value from KV"""
         return self.get(
             f"/accounts/{self.account_id}/storage/kv/namespaces/{namespace_id}/values/{key}"
         )
 
-    def kv_put(self, namespace_id: str, key: str, value: str) -> APIResponse:
-        """Put a value to KV"""
-        return self.put(
+    def kv_put(self, namespace_id: str, key: str, value: Union[str, bytes]) -> APIResponse:
+        """Put a value to KV (sent as the raw request body)"""
+        return self._request(
+            'PUT',
             f"/accounts/{self.account_id}/storage/kv/namespaces/{namespace_id}/values/{key}",
-            data={"value": value}
+            raw=value.encode('utf-8') if isinstance(value, str) else value
         )
 
+    def _kv_bulk_endpoint(self, namespace_id: str) -> str:
+        return f"/accounts/{self.account_id}/storage/kv/namespaces/{namespace_id}/bulk"
+
+    def kv_bulk_put(self, namespace_id: str, entries: List[Dict[str, str]]) -> APIResponse:
+        """Write up to 10,000 {key, value} pairs in a single bulk request"""
+        return self._request('PUT', self._kv_bulk_endpoint(namespace_id), data=entries)
+
+    async def akv_bulk_put(self, namespace_id: str,
+                           entries: List[Dict[str, str]]) -> APIResponse:
+        """Async variant of kv_bulk_put"""
+        if _lazy_aiohttp() is None:
+            return await asyncio.to_thread(self.kv_bulk_put, namespace_id, entries)
+        return await self._arequest('PUT', self._kv_bulk_endpoint(namespace_id), data=entries)
+
+
+# OAuth tokens are cached here so separate runs can skip the login POST
+_SF_TOKEN_CACHE = Path.home() / '.blackroad' / 'sf_token.json'
+
 
 class SalesforceAPI(BaseAPI):
     """Salesforce API integration"""
 
     name = "salesforce"
     auth_type = "oauth2"
+    _health_endpoint = "/sobjects"
+    # sObject Collections accept at most 200 records per request
+    COLLECTION_LIMIT = 200
+    # Seconds to wait after a failed login before requests try again
+    _AUTH_RETRY_DELAY = 30.0
 
     def __init__(self):
         self.instance_url = os.getenv("SF_INSTANCE_URL", "")
         self.base_url = f"{self.instance_url}/services/data/v58.0"
-        super().__init__()
         self._access_token = None
+        self._token_expiry = 0.0
+        self._auth_failed_at: Optional[float] = None
+        self._token_lock = threading.Lock()
+        super().__init__()
+
+    def authenticate(self, force: bool = False) -> bool:
+        """
+        Authenticate with Salesforce OAuth2
+
+        A still-valid token cached on disk for the same user is reused
+        unless force is set.
+        """
+        if not force and self._load_cached_token():
+            return True
 
-    def authenticate(self) -> bool:
-        """Authenticate with Salesforce OAuth2"""
+        requests = _lazy_requests()
         if requests is None:
             return False
 
+        credentials = {
+            name: os.getenv(name)
+            for name in ('SF_CLIENT_ID', 'SF_CLIENT_SECRET', 'SF_USERNAME', 'SF_PASSWORD')
+        }
+        missing = [name for name, value in credentials.items() if not value]
+        if missing:
+            logger.warning(f"Salesforce credentials not set: {', '.join(missing)}")
+            return False
+
+        # Reuse the pooled session, but don't send the stale bearer token
+        # to the login endpoint
+        session = self._get_session()
+        session.headers.pop('Authorization', None)
+
         login_url = "https://login.salesforce.com/services/oauth2/token"
 
-        response = requests.post(login_url, data={
-            'grant_type': 'password',
-            'client_id': os.getenv('SF_CLIENT_ID'),
-            'client_secret': os.getenv('SF_CLIENT_SECRET'),
-            'username': os.getenv('SF_USERNAME'),
-            'password': os.getenv('SF_PASSWORD') + os.getenv('SF_SECURITY_TOKEN', '')
-        })
+        try:
+            response = session.post(
+                login_url,
+                data={
+                    'grant_type': 'password',
+                    'client_id': credentials['SF_CLIENT_ID'],
+                    'client_secret': credentials['SF_CLIENT_SECRET'],
+                    'username': credentials['SF_USERNAME'],
+                    'password': credentials['SF_PASSWORD'] + os.getenv('SF_SECURITY_TOKEN', '')
+                },
+                headers={'Content-Type': 'application/x-www-form-urlencoded'},
+                timeout=self.timeout
+            )
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Salesforce authentication failed: {e}")
+            return False
 
         if response.ok:
             data = response.json()
-            self._access_token = data['access_token']
-            self.instance_url = data['instance_url']
-            self.base_url = f"{self.instance_url}/services/data/v58.0"
+            # Refresh a minute early so in-flight requests never carry a stale token
+            ttl = int(data.get('expires_in', 3600)) - 60
+            self._apply_token(data['access_token'], data['instance_url'], ttl)
+            self._save_cached_token(time.time() + ttl)
             return True
         return False
 
-    def _get_headers(self) -> Dict[str, str]:
-        headers = super()._get_headers()
+    def _apply_token(self, access_token: str, instance_url: str, ttl: float) -> None:
+        """Install a token and rebuild everything derived from the instance URL"""
+        self._access_token = access_token
+        self._token_expiry = time.monotonic() + ttl
+        self.instance_url = instance_url
+        self.base_url = f"{self.instance_url}/services/data/v58.0"
+        self._base = self.base_url.rstrip('/')
+        self._url_cache.clear()
+        self._static_headers = self._build_headers()
+        if self._session is not None:
+            self._session.headers.update(self._static_headers)
+
+    def _load_cached_token(self) -> bool:
+        """Apply the on-disk token if it belongs to this user and has not expired"""
+        try:
+            cached = json.loads(_SF_TOKEN_CACHE.read_text())
+        except (OSError, ValueError):
+            return False
+        if not isinstance(cached, dict) or cached.get('username') != os.getenv('SF_USERNAME'):
+            return False
+        try:
+            ttl = float(cached['expires_at']) - time.time()
+            if ttl <= 0:
+                return False
+            self._apply_token(cached['access_token'], cached['instance_url'], ttl)
+        except (KeyError, TypeError, ValueError):
+            return False
+        return True
+
+    def _save_cached_token(self, expires_at: float) -> None:
+        """Persist the current token, readable only by the owner"""
+        payload = json.dumps({
+            'username': os.getenv('SF_USERNAME'),
+            'access_token': self._access_token,
+            'instance_url': self.instance_url,
+            'expires_at': expires_at
+        })
+        try:
+            _SF_TOKEN_CACHE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd = os.open(_SF_TOKEN_CACHE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                # The creation mode does not apply to an existing file
+                os.fchmod(f.fileno(), 0o600)
+                f.write(payload)
+        except OSError as e:
+            logger.debug(f"Could not cache Salesforce token: {e}")
+
+    def _needs_token(self) -> bool:
+        """True if a login should be attempted now"""
+        now = time.monotonic()
+        if self._access_token and now < self._token_expiry:
+            return False
+        # Don't hammer the login endpoint after a failure
+        return (self._auth_failed_at is None
+                or now - self._auth_failed_at >= self._AUTH_RETRY_DELAY)
+
+    def _ensure_token(self) -> None:
+        """Authenticate if there is no token or it is about to expire"""
+        if not self._needs_token():
+            return
+        with self._token_lock:
+            # Another thread may have refreshed while we waited
+            if self._needs_token():
+                ok = self.authenticate()
+                self._auth_failed_at = None if ok else time.monotonic()
+
+    def _request(self,
+                 method: str,
+                 endpoint: str,
+                 data: Optional[Union[dict, list]] = None,
+                 params: Optional[dict] = None,
+                 headers: Optional[dict] = None,
+                 raw: Optional[bytes] = None) -> APIResponse:
+        self._ensure_token()
+        return super()._request(method, endpoint, data=data, params=params,
+                                headers=headers, raw=raw)
+
+    def _build_headers(self) -> Dict[str, str]:
+        headers = super()._build_headers()
         if self._access_token:
             headers['Authorization'] = f'Bearer {self._access_token}'
         return headers
 
-    def health_check(self) -> HealthCheckResult:
-        if not self._access_token:
-            self.authenticate()
-        start = time.time()
-        response = self.get("/sobjects")
-        return HealthCheckResult(
-            endpoint=f"{self.base_url}/sobjects",
-            healthy=response.success,
-            status_code=response.status_code,
-            latency_ms=(time.time() - start) * 1000,
-            error=response.error
+    async def ahealth_check(self) -> HealthCheckResult:
+        await asyncio.to_thread(self._ensure_token)
+        return await super().ahealth_check()
+
+    def upsert_collection(self, sobject: str, external_id_field: str,
+                          records: List[Dict[str, Any]]) -> APIResponse:
+        """
+        Upsert up to COLLECTION_LIMIT records in one composite request
+
+        The response data is a per-record list of {id, success, created, errors}.
+        """
+        payload = [{'attributes': {'type': sobject}, **r} for r in records]
+        return self.patch(
+            f'/composite/sobjects/{sobject}/{external_id_field}',
+            data={'allOrNone': False, 'records': payload}
         )
 
 
@@ -310,6 +738,7 @@ class VercelAPI(BaseAPI):
     name = "vercel"
     base_url = "https://api.vercel.com"
     auth_type = "bearer"
+    _health_endpoint = "/v2/user"
 
     def __init__(self, api_key: Optional[str] = None):
         super().__init__(
@@ -317,17 +746,6 @@ class VercelAPI(BaseAPI):
             env_var="VERCEL_TOKEN"
         )
 
-    def health_check(self) -> HealthCheckResult:
-        start = time.time()
-        response = self.get("/v2/user")
-        return HealthCheckResult(
-            endpoint=f"{self.base_url}/v2/user",
-            healthy=response.success,
-            status_code=response.status_code,
-            latency_ms=(time.time() - start) * 1000,
-            error=response.error
-        )
-
 
 class DigitalOceanAPI(BaseAPI):
     """Digital Ocean API integration"""
@@ -335,6 +753,7 @@ class DigitalOceanAPI(BaseAPI):
     name = "digitalocean"
     base_url = "https://api.digitalocean.com/v2"
     auth_type = "bearer"
+    _health_endpoint = "/account"
 
     def __init__(self, api_key: Optional[str] = None):
         super().__init__(
@@ -342,17 +761,6 @@ class DigitalOceanAPI(BaseAPI):
             env_var="DIGITALOCEAN_TOKEN"
         )
 
-    def health_check(self) -> HealthCheckResult:
-        start = time.time()
-        response = self.get("/account")
-        return HealthCheckResult(
-            endpoint=f"{self.base_url}/account",
-            healthy=response.success,
-            status_code=response.status_code,
-            latency_ms=(time.time() - start) * 1000,
-            error=response.error
-        )
-
 
 class ClaudeAPI(BaseAPI):
     """Claude/Anthropic API integration"""
@@ -360,6 +768,11 @@ class ClaudeAPI(BaseAPI):
     name = "claude"
     base_url = "https://api.anthropic.com/v1"
     auth_type = "x-api-key"
+    # Listing models is a cheap authenticated GET that avoids the billed
+    # /messages path; auth and rate-limit errors still prove reachability
+    _health_endpoint = "/models"
+    _health_params = {'limit': 1}
+    _health_ok_codes = (200, 401, 403, 429)
 
     def __init__(self, api_key: Optional[str] = None):
         super().__init__(
@@ -367,32 +780,11 @@ class ClaudeAPI(BaseAPI):
             env_var="ANTHROPIC_API_KEY"
         )
 
-    def _get_headers(self) -> Dict[str, str]:
-        headers = super()._get_headers()
+    def _build_headers(self) -> Dict[str, str]:
+        headers = super()._build_headers()
         headers['anthropic-version'] = '2023-06-01'
         return headers
 
-    def health_check(self) -> HealthCheckResult:
-        # For Claude, we check if the API responds at all
-        # A 400 error still means the API is up
-        start = time.time()
-        response = self.post("/messages", data={
-            "model": "claude-haiku-3-5-20241022",
-            "max_tokens": 1,
-            "messages": [{"role": "user", "content": "ping"}]
-        })
-
-        # API is healthy if we get any response (including 400 for invalid request)
-        healthy = response.status_code in [200, 400, 401, 429]
-
-        return HealthCheckResult(
-            endpoint=f"{self.base_url}/messages",
-            healthy=healthy,
-            status_code=response.status_code,
-            latency_ms=(time.time() - start) * 1000,
-            error=None if healthy else response.error
-        )
-
 
 class GitHubAPI(BaseAPI):
     """GitHub API integration"""
@@ -400,6 +792,7 @@ class GitHubAPI(BaseAPI):
     name = "github"
     base_url = "https://api.github.com"
     auth_type = "bearer"
+    _health_endpoint = "/rate_limit"
 
     def __init__(self, api_key: Optional[str] = None):
         super().__init__(
@@ -407,17 +800,6 @@ class GitHubAPI(BaseAPI):
             env_var="GITHUB_TOKEN"
         )
 
-    def health_check(self) -> HealthCheckResult:
-        start = time.time()
-        response = self.get("/rate_limit")
-        return HealthCheckResult(
-            endpoint=f"{self.base_url}/rate_limit",
-            healthy=response.success,
-            status_code=response.status_code,
-            latency_ms=(time.time() - start) * 1000,
-            error=response.error
-        )
-
 
 # API Registry
 class APIRegistry:
@@ -433,20 +815,54 @@ class APIRegistry:
     }
 
     _instances: Dict[str, BaseAPI] = {}
+    _instances_lock = threading.Lock()
+    _prewarmed: bool = False
+
+    # Overall deadline (seconds) for the threaded health check fan-out
+    _HC_TIMEOUT: float = 120
 
     @classmethod
     def register(cls, name: str, api_class: type) -> None:
         """Register a new API integration"""
         cls._apis[name] = api_class
+        cls._prewarmed = False
 
     @classmethod
     def get(cls, name: str) -> BaseAPI:
         """Get or create an API instance"""
-        if name not in cls._instances:
-            if name not in cls._apis:
-                raise ValueError(f"Unknown API: {name}")
-            cls._instances[name] = cls._apis[name]()
-        return cls._instances[name]
+        # Locked so concurrent health checks never build duplicate instances
+        with cls._instances_lock:
+            instance = cls._instances.get(name)
+            if instance is None:
+                if name not in cls._apis:
+                    raise ValueError(f"Unknown API: {name}")
+                instance = cls._apis[name]()
+                cls._instances[name] = instance
+            return instance
+
+    @classmethod
+    def prewarm(cls) -> None:
+        """Instantiate all registered APIs ahead of repeated health checks"""
+        for name in cls._apis:
+            try:
+                cls.get(name)
+            except Exception:
+                pass
+        cls._prewarmed = True
+
+    @classmethod
+    def _instance(cls, name: str) -> BaseAPI:
+        """Prewarmed instance lookup; falls back to get() to surface init errors"""
+        return cls._instances.get(name) or cls.get(name)
+
+    @staticmethod
+    def _in_event_loop() -> bool:
+        """Check whether an event loop is already running in this thread"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
 
     @classmethod
     def list_apis(cls) -> List[str]:
@@ -454,23 +870,92 @@ class APIRegistry:
         return list(cls._apis.keys())
 
     @classmethod
-    def health_check_all(cls) -> Dict[str, HealthCheckResult]:
-        """Run health checks on all registered APIs"""
+    async def ahealth_check_all(cls, use_cache: bool = True) -> Dict[str, HealthCheckResult]:
+        """Run health checks on all registered APIs concurrently"""
+        if not cls._prewarmed:
+            cls.prewarm()
+
         results = {}
+        instances = []
         for name in cls._apis:
             try:
-                api = cls.get(name)
-                results[name] = api.health_check()
+                instances.append((name, cls._instance(name)))
             except Exception as e:
                 results[name] = HealthCheckResult(
                     endpoint=name,
                     healthy=False,
                     error=str(e)
                 )
-        return results
+
+        outcomes = await asyncio.gather(
+            *[api.acached_health_check(use_cache) for _, api in instances],
+            return_exceptions=True
+        )
+        for (name, _), outcome in zip(instances, outcomes):
+            if isinstance(outcome, BaseException):
+                results[name] = HealthCheckResult(
+                    endpoint=name,
+                    healthy=False,
+                    error=str(outcome)
+                )
+            else:
+                results[name] = outcome
+
+        return {name: results[name] for name in cls._apis}
+
+    @classmethod
+    def health_check_all(cls, use_cache: bool = True) -> Dict[str, HealthCheckResult]:
+        """Run health checks on all registered APIs"""
+        if _lazy_aiohttp() is not None and not cls._in_event_loop():
+            async def _run():
+                try:
+                    return await cls.ahealth_check_all(use_cache)
+                finally:
+                    await _AsyncTransport.close()
+            return asyncio.run(_run())
+
+        if not cls._prewarmed:
+            cls.prewarm()
+
+        # Threaded fallback: checks are I/O-bound, so threads overlap the RTTs
+        names = list(cls._apis)
+        if not names:
+            return {}
+
+        def _check(name: str) -> HealthCheckResult:
+            try:
+                return cls._instance(name).cached_health_check(use_cache)
+            except Exception as e:
+                return HealthCheckResult(
+                    endpoint=name,
+                    healthy=False,
+                    error=str(e)
+                )
+
+        results = {}
+        executor = ThreadPoolExecutor(max_workers=min(16, len(names)))
+        try:
+            futures = {executor.submit(_check, name): name for name in names}
+            for future in as_completed(futures, timeout=cls._HC_TIMEOUT):
+                results[futures[future]] = future.result()
+        except TimeoutError:
+            pass
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return {
+            name: results.get(name) or HealthCheckResult(
+                endpoint=name,
+                healthy=False,
+                error="timeout"
+            )
+            for name in names
+        }
 
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
     # Quick test of available APIs
     print("BlackRoad API Integrations")
     print("=" * 40)
@@ -6,18 +6,21 @@ Support for iOS development tools: iSH, Shellfish, Working Copy, Pyto
 
 import os
 import json
+import functools
 import subprocess
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from urllib.parse import quote, urlencode
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MobileToolConfig:
     """Configuration for a mobile tool"""
     name: str
     url_scheme: str
-    features: List[str]
+    features: Tuple[str, ...]
     setup_required: bool = False
 
 
@@ -32,60 +35,64 @@ class WorkingCopyIntegration:
     URL_SCHEME = "working-copy://"
     X_CALLBACK = "working-copy://x-callback-url"
 
+    @staticmethod
+    def _cb(action: str, **params: str) -> str:
+        """Build an x-callback URL for an action"""
+        query = urlencode(params, safe='/', quote_via=quote)
+        return f"{WorkingCopyIntegration.X_CALLBACK}/{action}?{query}"
+
     @staticmethod
     def clone_url(repo_url: str, path: Optional[str] = None) -> str:
         """Generate URL to clone a repository"""
-        params = {'url': repo_url}
         if path:
-            params['path'] = path
-        return f"{WorkingCopyIntegration.X_CALLBACK}/clone?{urlencode(params)}"
+            return WorkingCopyIntegration._cb('clone', url=repo_url, path=path)
+        return WorkingCopyIntegration._cb('clone', url=repo_url)
 
     @staticmethod
     def pull_url(repo_name: str) -> str:
         """Generate URL to pull a repository"""
-        return f"{WorkingCopyIntegration.X_CALLBACK}/pull?repo={quote(repo_name)}"
+        return WorkingCopyIntegration._cb('pull', repo=repo_name)
 
     @staticmethod
     def push_url(repo_name: str) -> str:
         """Generate URL to push a repository"""
-        return f"{WorkingCopyIntegration.X_CALLBACK}/push?repo={quote(repo_name)}"
+        return WorkingCopyIntegration._cb('push', repo=repo_name)
 
     @staticmethod
     def commit_url(repo_name: str, message: str, add_all: bool = True) -> str:
         """Generate URL to commit changes"""
-        params = {
-            'repo': repo_name,
-            'message': message
-        }
         if add_all:
-            params['add'] = 'all'
-        return f"{WorkingCopyIntegration.X_CALLBACK}/commit?{urlencode(params)}"
+            return WorkingCopyIntegration._cb('commit', repo=repo_name, message=message, add='all')
+        return WorkingCopyIntegration._cb('commit', repo=repo_name, message=message)
 
     @staticmethod
     def open_file_url(repo_name: str, path: str) -> str:
         """Generate URL to open a file"""
-        return f"{WorkingCopyIntegration.X_CALLBACK}/open?repo={quote(repo_name)}&path={quote(path)}"
+        return WorkingCopyIntegration._cb('open', repo=repo_name, path=path)
+
+    # Action type -> URL builder used by chain_actions
+    _CHAIN_ACTIONS = {
+        'pull': lambda a: WorkingCopyIntegration.pull_url(a['repo']),
+        'push': lambda a: WorkingCopyIntegration.push_url(a['repo']),
+        'commit': lambda a: WorkingCopyIntegration.commit_url(
+            a['repo'],
+            a.get('message', 'Auto commit')
+        ),
+    }
 
     @staticmethod
-    def chain_actions(actions: List[Dict[str, Any]]) -> str:
+    def chain_actions(actions: List[Dict[str, Any]]) -> List[str]:
         """
         Chain multiple Working Copy actions
 
         Actions format: [{'action': 'pull', 'repo': 'myrepo'}, ...]
         """
-        urls = []
-        for action in actions:
-            action_type = action.get('action')
-            if action_type == 'pull':
-                urls.append(WorkingCopyIntegration.pull_url(action['repo']))
-            elif action_type == 'push':
-                urls.append(WorkingCopyIntegration.push_url(action['repo']))
-            elif action_type == 'commit':
-                urls.append(WorkingCopyIntegration.commit_url(
-                    action['repo'],
-                    action.get('message', 'Auto commit')
-                ))
-        return urls
+        dispatch = WorkingCopyIntegration._CHAIN_ACTIONS
+        return [
+            dispatch[action['action']](action)
+            for action in actions
+            if action.get('action') in dispatch
+        ]
 
 
 class PytoIntegration:
@@ -115,6 +122,7 @@ class PytoIntegration:
         return f"pyto://open?path={quote(file_path)}"
 
     @staticmethod
+    @functools.cache
     def generate_backup_script() -> str:
         """Generate a backup automation script for Pyto"""
         return '''#!/usr/bin/env python3
@@ -172,6 +180,7 @@ class ISHIntegration:
     ]
 
     @staticmethod
+    @functools.cache
     def generate_setup_script() -> str:
         """Generate iSH setup script"""
         packages = ' '.join(ISHIntegration.ESSENTIAL_PACKAGES)
@@ -207,6 +216,7 @@ echo "Run 'source ~/blackroad/venv/bin/activate' to activate Python environment"
 '''
 
     @staticmethod
+    @functools.cache
     def generate_backup_script() -> str:
         """Generate backup shell script for iSH"""
         return '''#!/bin/sh
@@ -271,17 +281,51 @@ class ShellfishIntegration:
         username: str = "pi"
     ) -> List[Dict[str, Any]]:
         """Generate configs for Pi cluster"""
+        # Same shape as generate_connection_config, built from one shared template
+        base = {"username": username, "protocol": "sftp"}
         return [
-            ShellfishIntegration.generate_connection_config(
-                host=h['host'],
-                username=username,
-                port=h.get('port', 22),
-                key_name=h.get('key_name')
-            )
+            {
+                "name": f"BlackRoad - {h['host']}",
+                "host": h['host'],
+                "port": h.get('port', 22),
+                **base,
+                **({"privateKey": h['key_name']} if h.get('key_name') else {})
+            }
             for h in hosts
         ]
 
 
+@functools.cache
+def _all_tools() -> tuple:
+    """Static mobile tool configurations, built once"""
+    return (
+        MobileToolConfig(
+            name="Working Copy",
+            url_scheme="working-copy://",
+            features=("git", "github", "code_editing", "pr_management"),
+            setup_required=False
+        ),
+        MobileToolConfig(
+            name="Pyto",
+            url_scheme="pyto://",
+            features=("python", "pip", "shortcuts"),
+            setup_required=True
+        ),
+        MobileToolConfig(
+            name="iSH",
+            url_scheme="ish://",
+            features=("alpine_linux", "apk", "shell", "git"),
+            setup_required=True
+        ),
+        MobileToolConfig(
+            name="Shellfish",
+            url_scheme="shellfish://",
+            features=("sftp", "ssh", "file_transfer"),
+            setup_required=False
+        )
+    )
+
+
 class MobileToolsManager:
     """
     Manager for all mobile tool integrations
@@ -295,32 +339,7 @@ class MobileToolsManager:
 
     def get_all_tools(self) -> List[MobileToolConfig]:
         """Get configuration for all mobile tools"""
-        return [
-            MobileToolConfig(
-                name="Working Copy",
-                url_scheme="working-copy://",
-                features=["git", "github", "code_editing", "pr_management"],
-                setup_required=False
-            ),
-            MobileToolConfig(
-                name="Pyto",
-                url_scheme="pyto://",
-                features=["python", "pip", "shortcuts"],
-                setup_required=True
-            ),
-            MobileToolConfig(
-                name="iSH",
-                url_scheme="ish://",
-                features=["alpine_linux", "apk", "shell", "git"],
-                setup_required=True
-            ),
-            MobileToolConfig(
-                name="Shellfish",
-                url_scheme="shellfish://",
-                features=["sftp", "ssh", "file_transfer"],
-                setup_required=False
-            )
-        ]
+        return list(_all_tools())
 
     def generate_all_setup_scripts(self) -> Dict[str, str]:
         """Generate setup scripts for all tools"""
@@ -330,6 +349,19 @@ class MobileToolsManager:
             "pyto_backup.py": self.pyto.generate_backup_script()
         }
 
+    def write_all(self, out_dir: str) -> None:
+        """Write all setup scripts to a directory, one file per script"""
+        out_path = Path(out_dir)
+        out_path.mkdir(parents=True, exist_ok=True)
+        scripts = self.generate_all_setup_scripts()
+
+        # Overlap the per-file open/write/close latency across threads
+        with ThreadPoolExecutor(max_workers=len(scripts)) as executor:
+            list(executor.map(
+                lambda item: (out_path / item[0]).write_bytes(item[1].encode()),
+                scripts.items()
+            ))
+
     def get_working_copy_workflow(self, repo_name: str) -> List[str]:
         """Get complete Working Copy workflow URLs"""
         return [
@@ -5,13 +5,48 @@ Sync SSH hosts and configurations with Termius
 """
 
 import os
+import sys
 import json
+import functools
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=None)
+def _env(key: str, default: Optional[str] = None) -> Optional[str]:
+    """Read an environment variable once per process"""
+    return os.environ.get(key, default)
+
+
+# Shared tag/group strings for generated hosts
+_TAG_BLACKROAD = sys.intern("blackroad")
+_PI_TAGS = (_TAG_BLACKROAD, sys.intern("raspberry-pi"), sys.intern("cluster"))
+_PI_GROUP = sys.intern("Pi Cluster")
+_CLOUD_GROUP = sys.intern("Cloud Servers")
+_CLOUD_TAG_CACHE: Dict[str, tuple] = {}
+
+
+def _cloud_tags(provider: str) -> tuple:
+    """Tag tuple for a cloud provider, built once per provider"""
+    tags = _CLOUD_TAG_CACHE.get(provider)
+    if tags is None:
+        tags = (_TAG_BLACKROAD, sys.intern(provider.lower()))
+        _CLOUD_TAG_CACHE[provider] = tags
+    return tags
+
+
+@dataclass(slots=True)
 class TermiusHost:
     """Termius host configuration"""
     label: str
@@ -26,16 +61,25 @@ class TermiusHost:
         if self.tags is None:
             self.tags = []
 
+    _SCALAR_FIELDS = ('label', 'address', 'port', 'username', 'ssh_key', 'group')
+
     def to_dict(self) -> dict:
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        d = {f: v for f in self._SCALAR_FIELDS
+             if (v := getattr(self, f)) is not None}
+        if self.tags is not None:
+            d['tags'] = list(self.tags)
+        return d
 
 
-@dataclass
+@dataclass(slots=True)
 class TermiusGroup:
     """Termius group/folder configuration"""
     label: str
     parent: Optional[str] = None
 
+    def to_dict(self) -> dict:
+        return {'label': self.label, 'parent': self.parent}
+
 
 class TermiusSync:
     """
@@ -48,7 +92,7 @@ class TermiusSync:
     """
 
     def __init__(self, api_key: Optional[str] = None):
-        self.api_key = api_key or os.getenv("TERMIUS_API_KEY")
+        self.api_key = api_key or _env("TERMIUS_API_KEY")
         self.api_base = "https://api.termius.com"
 
     def create_blackroad_groups(self) -> List[TermiusGroup]:
@@ -73,8 +117,8 @@ class TermiusSync:
                 port=host.get('port', 22),
                 username=username,
                 ssh_key=host.get('ssh_key'),
-                group="Pi Cluster",
-                tags=["blackroad", "raspberry-pi", "cluster"]
+                group=_PI_GROUP,
+                tags=list(_PI_TAGS)
             )
             for i, host in enumerate(hosts)
         ]
@@ -85,6 +129,7 @@ class TermiusSync:
         hosts: List[Dict[str, Any]]
     ) -> List[TermiusHost]:
         """Create Termius hosts for cloud servers"""
+        tags = _cloud_tags(provider)
         return [
             TermiusHost(
                 label=host.get('name', f"{provider}-{i}"),
@@ -92,8 +137,8 @@ class TermiusSync:
                 port=host.get('port', 22),
                 username=host.get('username', 'root'),
                 ssh_key=host.get('ssh_key'),
-                group="Cloud Servers",
-                tags=["blackroad", provider.lower()]
+                group=_CLOUD_GROUP,
+                tags=list(tags)
             )
             for i, host in enumerate(hosts)
         ]
@@ -108,7 +153,7 @@ class TermiusSync:
             "version": "1.0",
             "generated": datetime.utcnow().isoformat(),
             "source": "blackroad-backup-automator",
-            "groups": [asdict(g) for g in groups],
+            "groups": [g.to_dict() for g in groups],
             "hosts": [h.to_dict() for h in hosts],
             "metadata": {
                 "total_groups": len(groups),
@@ -118,8 +163,19 @@ class TermiusSync:
 
     def export_to_json(self, filepath: str, manifest: Dict[str, Any]) -> None:
         """Export manifest to JSON file"""
-        with open(filepath, 'w') as f:
-            json.dump(manifest, f, indent=2)
+        # Encode once and emit a single write
+        if msgspec is not None:
+            payload = msgspec.json.format(
+                msgspec.json.encode(manifest, order='sorted'), indent=2
+            )
+        elif orjson is not None:
+            payload = orjson.dumps(
+                manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            )
+        else:
+            payload = json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8')
+        with open(filepath, 'wb') as f:
+            f.write(payload)
 
 
 def create_default_infrastructure() -> Dict[str, Any]:
@@ -131,18 +187,18 @@ def create_default_infrastructure() -> Dict[str, Any]:
 
     # Create Pi cluster hosts (using env vars for actual IPs)
     pi_hosts = [
-        {"name": "pi-master", "host": os.getenv("PI_MASTER_HOST", "192.168.1.100")},
-        {"name": "pi-worker-1", "host": os.getenv("PI_WORKER_1_HOST", "192.168.1.101")},
-        {"name": "pi-worker-2", "host": os.getenv("PI_WORKER_2_HOST", "192.168.1.102")},
-        {"name": "pi-worker-3", "host": os.getenv("PI_WORKER_3_HOST", "192.168.1.103")},
+        {"name": "pi-master", "host": _env("PI_MASTER_HOST", "192.168.1.100")},
+        {"name": "pi-worker-1", "host": _env("PI_WORKER_1_HOST", "192.168.1.101")},
+        {"name": "pi-worker-2", "host": _env("PI_WORKER_2_HOST", "192.168.1.102")},
+        {"name": "pi-worker-3", "host": _env("PI_WORKER_3_HOST", "192.168.1.103")},
     ]
     pi_cluster = sync.create_pi_cluster_hosts(pi_hosts)
 
     # Create cloud hosts (placeholder)
     do_hosts = []
-    if os.getenv("DO_SERVER_IP"):
+    if _env("DO_SERVER_IP"):
         do_hosts = sync.create_cloud_hosts("digitalocean", [
-            {"name": "do-primary", "ip": os.getenv("DO_SERVER_IP")}
+            {"name": "do-primary", "ip": _env("DO_SERVER_IP")}
         ])
 
     all_hosts = pi_cluster + do_hosts
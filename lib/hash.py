@@ -14,20 +14,121 @@ Provides cryptographic hashing for:
 import hashlib
 import hmac
 import json
+import mmap
 import os
-from typing import Any, Dict, List, Optional, Union
-from datetime import datetime
+import time
+from fnmatch import fnmatchcase
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Union
+from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+
+def _canonical_json(data: Any) -> bytes:
+    """
+    Key-sorted JSON bytes for hashing dicts and lists
+
+    Exactly the bytes SHAInfinity.hash has always used, so stored hashes
+    keep verifying; always the stdlib encoder, whose output does not
+    depend on optional packages.
+    """
+    return json.dumps(data, sort_keys=True).encode('utf-8')
+
+
+def _config_json(data: Any) -> bytes:
+    """Compact, key-sorted JSON bytes as hash_config has always used"""
+    return json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def _to_bytes(data: Union[str, bytes, dict, list]) -> bytes:
+    """Encode hashable input the same way SHAInfinity.hash does"""
+    if type(data) is bytes:
+        # Hottest path: already bytes, nothing to convert
+        return data
+    if isinstance(data, str):
+        return data.encode('utf-8')
+    if isinstance(data, (dict, list)):
+        return _canonical_json(data)
+    return data
+
+
+# Config encodings hash_config can use; they give different hashes
+_CONFIG_ENCODERS: Dict[str, Callable[[Any], bytes]] = {
+    'json': _config_json,
+    'cbor': lambda data: cbor2.dumps(data, canonical=True),
+}
+
+
+# Read size for the chunked file-hash fallback (Python < 3.11)
+_CHUNK_SIZE = 1024 * 1024
+
+# Files at least this large are hashed from a memory map in a single update
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Manifests at least this large are verified with a thread pool
+_PARALLEL_MANIFEST_THRESHOLD = 100
+
+# hashlib constructors, bound once at import
+_CONSTRUCTORS = {
+    'sha256': hashlib.sha256,
+    'sha384': hashlib.sha384,
+    'sha512': hashlib.sha512,
+    'sha3_256': hashlib.sha3_256,
+    'sha3_512': hashlib.sha3_512,
+    'blake2b': hashlib.blake2b,
+    'blake2s': hashlib.blake2s,
+}
+
 
 class HashAlgorithm:
     """Base class for hash algorithms"""
 
+    # Algorithms are stateless singletons; _ctor stays a class attribute
+    __slots__ = ()
+
     name: str = "base"
     digest_size: int = 0
+    _ctor = None  # hashlib constructor; custom algorithms override hash()
 
     def hash(self, data: bytes) -> str:
-        raise NotImplementedError
+        if self._ctor is None:
+            raise NotImplementedError
+        return self._ctor(data).hexdigest()
+
+    def digest(self, data: bytes) -> bytes:
+        if self._ctor is None:
+            return bytes.fromhex(self.hash(data))
+        return self._ctor(data).digest()
+
+    def new(self):
+        """Fresh incremental hasher, or None for custom algorithms"""
+        return self._ctor() if self._ctor is not None else None
+
+    def hash_file(self, filepath: Union[str, Path]) -> str:
+        """Hash a file without loading it into memory"""
+        with open(filepath, 'rb') as f:
+            if self._ctor is None:
+                # Custom algorithm not backed by hashlib
+                return self.hash(f.read())
+            if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return self._ctor(mm).hexdigest()
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, self._ctor).hexdigest()
+            h = self._ctor()
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+                h.update(chunk)
+            return h.hexdigest()
 
     def verify(self, data: bytes, expected: str) -> bool:
         return self.hash(data) == expected
@@ -36,79 +137,91 @@ class HashAlgorithm:
 class SHA256(HashAlgorithm):
     """SHA-256 implementation"""
 
+    __slots__ = ()
     name = "sha256"
     digest_size = 32
-
-    def hash(self, data: bytes) -> str:
-        return hashlib.sha256(data).hexdigest()
-
-    def hash_file(self, filepath: Union[str, Path]) -> str:
-        """Hash a file in chunks for memory efficiency"""
-        sha256 = hashlib.sha256()
-        with open(filepath, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+    _ctor = _CONSTRUCTORS['sha256']
 
 
 class SHA384(HashAlgorithm):
     """SHA-384 implementation"""
 
+    __slots__ = ()
     name = "sha384"
     digest_size = 48
-
-    def hash(self, data: bytes) -> str:
-        return hashlib.sha384(data).hexdigest()
+    _ctor = _CONSTRUCTORS['sha384']
 
 
 class SHA512(HashAlgorithm):
     """SHA-512 implementation"""
 
+    __slots__ = ()
     name = "sha512"
     digest_size = 64
-
-    def hash(self, data: bytes) -> str:
-        return hashlib.sha512(data).hexdigest()
+    _ctor = _CONSTRUCTORS['sha512']
 
 
 class SHA3_256(HashAlgorithm):
     """SHA3-256 implementation"""
 
+    __slots__ = ()
     name = "sha3_256"
     digest_size = 32
-
-    def hash(self, data: bytes) -> str:
-        return hashlib.sha3_256(data).hexdigest()
+    _ctor = _CONSTRUCTORS['sha3_256']
 
 
 class SHA3_512(HashAlgorithm):
     """SHA3-512 implementation"""
 
+    __slots__ = ()
     name = "sha3_512"
     digest_size = 64
-
-    def hash(self, data: bytes) -> str:
-        return hashlib.sha3_512(data).hexdigest()
+    _ctor = _CONSTRUCTORS['sha3_512']
 
 
 class BLAKE2b(HashAlgorithm):
     """BLAKE2b implementation (fast, secure)"""
 
+    __slots__ = ()
     name = "blake2b"
     digest_size = 64
-
-    def hash(self, data: bytes) -> str:
-        return hashlib.blake2b(data).hexdigest()
+    _ctor = _CONSTRUCTORS['blake2b']
 
 
 class BLAKE2s(HashAlgorithm):
     """BLAKE2s implementation (optimized for 32-bit)"""
 
+    __slots__ = ()
     name = "blake2s"
     digest_size = 32
+    _ctor = _CONSTRUCTORS['blake2s']
+
+
+class BLAKE3(HashAlgorithm):
+    """BLAKE3 implementation (SIMD + multithreaded, requires blake3 package)"""
+
+    __slots__ = ()
+    name = "blake3"
+    digest_size = 32
 
     def hash(self, data: bytes) -> str:
-        return hashlib.blake2s(data).hexdigest()
+        return _blake3.blake3(data).hexdigest()
+
+    def digest(self, data: bytes) -> bytes:
+        return _blake3.blake3(data).digest()
+
+    def new(self):
+        return _blake3.blake3()
+
+    def hash_file(self, filepath: Union[str, Path]) -> str:
+        hasher = _blake3.blake3(max_threads=_blake3.blake3.AUTO)
+        if hasattr(hasher, 'update_mmap'):
+            hasher.update_mmap(str(filepath))
+        else:
+            with open(filepath, 'rb') as f:
+                for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+                    hasher.update(chunk)
+        return hasher.hexdigest()
 
 
 # SHA Infinity - Extensible Hash Registry
@@ -130,6 +243,8 @@ class SHAInfinity:
         'blake2b': BLAKE2b(),
         'blake2s': BLAKE2s(),
     }
+    if _blake3 is not None:
+        _algorithms['blake3'] = BLAKE3()
 
     # Default algorithm
     _default = 'sha256'
@@ -142,9 +257,10 @@ class SHAInfinity:
     @classmethod
     def get(cls, name: str) -> HashAlgorithm:
         """Get a hash algorithm by name"""
-        if name not in cls._algorithms:
+        algo = cls._algorithms.get(name)
+        if algo is None:
             raise ValueError(f"Unknown algorithm: {name}")
-        return cls._algorithms[name]
+        return algo
 
     @classmethod
     def list_algorithms(cls) -> List[str]:
@@ -164,14 +280,12 @@ class SHAInfinity:
         Returns:
             Hex-encoded hash string
         """
-        algo = cls.get(algorithm or cls._default)
-
-        if isinstance(data, str):
-            data = data.encode('utf-8')
-        elif isinstance(data, (dict, list)):
-            data = json.dumps(data, sort_keys=True).encode('utf-8')
+        return cls.get(algorithm or cls._default).hash(_to_bytes(data))
 
-        return algo.hash(data)
+    @classmethod
+    def hash_bytes(cls, data: bytes, algorithm: str = None) -> str:
+        """Hash raw bytes, skipping type dispatch"""
+        return cls.get(algorithm or cls._default).hash(data)
 
     @classmethod
     def hash_chain(cls, data: Union[str, bytes],
@@ -184,12 +298,12 @@ class SHAInfinity:
         if isinstance(data, str):
             data = data.encode('utf-8')
 
+        # Feed raw digests forward; hex-encode only the final link
         result = data
         for algo_name in algorithms:
-            algo = cls.get(algo_name)
-            result = algo.hash(result).encode('utf-8')
+            result = cls.get(algo_name).digest(result)
 
-        return result.decode('utf-8')
+        return result.hex() if algorithms else data.decode('utf-8')
 
     @classmethod
     def hmac_hash(cls, data: Union[str, bytes], key: bytes,
@@ -203,7 +317,7 @@ class SHAInfinity:
             # Use standard hashlib for these
             return cls.hash(key + data, algo_name)
 
-        hash_func = getattr(hashlib, algo_name)
+        hash_func = _CONSTRUCTORS.get(algo_name) or getattr(hashlib, algo_name)
         return hmac.new(key, data, hash_func).hexdigest()
 
 
@@ -212,15 +326,34 @@ class BlackRoadHasher:
     High-level hashing utilities for BlackRoad systems
     """
 
-    def __init__(self, algorithm: str = 'sha256'):
+    def __init__(self, algorithm: str = 'sha256',
+                 internal_algorithm: Optional[str] = None,
+                 config_encoding: str = 'json'):
+        if config_encoding not in _CONFIG_ENCODERS:
+            raise ValueError(f"Unknown config encoding: {config_encoding}")
+        if config_encoding == 'cbor' and cbor2 is None:
+            raise ValueError("config_encoding='cbor' requires the cbor2 package")
         self.algorithm = algorithm
+        # Chosen explicitly, never by what happens to be installed, so
+        # config hashes agree across machines
+        self.config_encoding = config_encoding
+        # Card IDs and manifests are internal, so they use BLAKE3 when it is
+        # installed; otherwise the requested algorithm, never a downgrade.
+        # Manifests record which one they used
+        self.internal_algorithm = internal_algorithm or (
+            'blake3' if _blake3 is not None else algorithm
+        )
         self.hasher = SHAInfinity
 
     def hash_config(self, config: dict) -> str:
-        """Hash a configuration dictionary"""
-        # Normalize and sort for consistent hashing
-        normalized = json.dumps(config, sort_keys=True, separators=(',', ':'))
-        return self.hasher.hash(normalized, self.algorithm)
+        """
+        Hash a configuration dictionary
+
+        Compact key-sorted JSON by default; with config_encoding='cbor',
+        canonical CBOR (smaller input, but different hashes).
+        """
+        encoded = _CONFIG_ENCODERS[self.config_encoding](config)
+        return self.hasher.hash_bytes(encoded, self.algorithm)
 
     def hash_file(self, filepath: Union[str, Path]) -> str:
         """Hash a file"""
@@ -228,34 +361,57 @@ class BlackRoadHasher:
         if not filepath.exists():
             raise FileNotFoundError(f"File not found: {filepath}")
 
-        algo = self.hasher.get(self.algorithm)
-        if hasattr(algo, 'hash_file'):
-            return algo.hash_file(filepath)
+        return self.hasher.get(self.algorithm).hash_file(filepath)
 
-        with open(filepath, 'rb') as f:
-            return self.hasher.hash(f.read(), self.algorithm)
+    @staticmethod
+    def _match_files(dirpath: Path, pattern: str) -> List[Path]:
+        """Files under dirpath matching pattern, in sorted order"""
+        if os.sep in pattern or '/' in pattern or '**' in pattern:
+            return [f for f in sorted(dirpath.glob(pattern)) if f.is_file()]
+        # Flat pattern: scandir entries carry d_type, saving a stat per file
+        with os.scandir(dirpath) as it:
+            names = sorted(e.name for e in it
+                           if fnmatchcase(e.name, pattern) and e.is_file())
+        return [dirpath / name for name in names]
 
     def hash_directory(self, dirpath: Union[str, Path],
                        pattern: str = '*') -> Dict[str, str]:
         """Hash all files in a directory matching pattern"""
         dirpath = Path(dirpath)
-        results = {}
-
-        for filepath in sorted(dirpath.glob(pattern)):
-            if filepath.is_file():
-                rel_path = str(filepath.relative_to(dirpath))
-                results[rel_path] = self.hash_file(filepath)
+        files = self._match_files(dirpath, pattern)
+
+        # hashlib releases the GIL while hashing, so files hash in parallel
+        workers = max(1, min(len(files), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            hashes = executor.map(self.hash_file, files)
+            return {
+                str(filepath.relative_to(dirpath)): digest
+                for filepath, digest in zip(files, hashes)
+            }
+
+    def aggregate_digest(self, file_hashes: Dict[str, str]) -> str:
+        """
+        Single 16-hex-char digest of a hash_directory() result
 
-        return results
+        Feeds `name NUL file-hash NUL` for each file, in sorted order, into
+        one BLAKE2b context.
+        """
+        rolling = hashlib.blake2b(digest_size=8)
+        for name in sorted(file_hashes):
+            rolling.update(name.replace(os.sep, '/').encode('utf-8'))
+            rolling.update(b'\0')
+            rolling.update(file_hashes[name].encode('ascii'))
+            rolling.update(b'\0')
+        return rolling.hexdigest()
 
     def generate_card_id(self, card_data: dict) -> str:
         """Generate unique ID for a kanban card"""
-        # Include timestamp for uniqueness
+        # Include a nanosecond timestamp for uniqueness
         data = {
             **card_data,
-            '_created': datetime.utcnow().isoformat()
+            '_created': time.time_ns()
         }
-        return self.hasher.hash(data, self.algorithm)[:16]
+        return self.hasher.hash(data, self.internal_algorithm)[:16]
 
     def generate_state_hash(self, state: dict) -> str:
         """Generate hash for state synchronization"""
@@ -268,20 +424,33 @@ class BlackRoadHasher:
         actual_hash = self.hasher.hash(data, algo)
         return hmac.compare_digest(actual_hash, expected_hash)
 
+    def _item_hasher(self, algorithm: str) -> Callable[[Any], str]:
+        """Per-item hash function cloning one pre-initialised hasher"""
+        algo = self.hasher.get(algorithm)
+        base = algo.new()
+        if base is None:
+            return lambda value: algo.hash(_to_bytes(value))
+
+        def hash_item(value: Any) -> str:
+            h = base.copy()
+            h.update(_to_bytes(value))
+            return h.hexdigest()
+
+        return hash_item
+
     def create_manifest(self, items: Dict[str, Any]) -> dict:
         """Create a hash manifest for multiple items"""
+        algorithm = self.internal_algorithm
+        hash_item = self._item_hasher(algorithm)
         manifest = {
-            'algorithm': self.algorithm,
-            'created': datetime.utcnow().isoformat(),
-            'items': {}
+            'algorithm': algorithm,
+            'created': datetime.now(timezone.utc).isoformat(),
+            'items': {k: hash_item(v) for k, v in items.items()}
         }
 
-        for key, value in items.items():
-            manifest['items'][key] = self.hasher.hash(value, self.algorithm)
-
         # Add manifest hash
         manifest['manifest_hash'] = self.hasher.hash(
-            manifest['items'], self.algorithm
+            manifest['items'], algorithm
         )
 
         return manifest
@@ -293,14 +462,27 @@ class BlackRoadHasher:
             'algorithm': manifest.get('algorithm', self.algorithm),
             'checks': {}
         }
-
-        for key, value in items.items():
-            expected = manifest.get('items', {}).get(key)
-            if expected is None:
+        hash_item = self._item_hasher(results['algorithm'])
+        expected_items = manifest.get('items', {})
+
+        # Hash everything up front; large manifests fan out across threads
+        # since hashlib releases the GIL while digesting
+        present = [k for k in items if expected_items.get(k) is not None]
+        values = [items[k] for k in present]
+        if len(present) >= _PARALLEL_MANIFEST_THRESHOLD:
+            workers = min(32, os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                actuals = dict(zip(present, executor.map(hash_item, values)))
+        else:
+            actuals = {k: hash_item(v) for k, v in zip(present, values)}
+
+        for key in items:
+            actual = actuals.get(key)
+            if actual is None:
                 results['checks'][key] = {'status': 'missing', 'valid': False}
                 results['valid'] = False
             else:
-                actual = self.hasher.hash(value, results['algorithm'])
+                expected = expected_items[key]
                 valid = hmac.compare_digest(actual, expected)
                 results['checks'][key] = {
                     'status': 'valid' if valid else 'invalid',
@@ -317,16 +499,29 @@ class BlackRoadHasher:
 # Convenience functions
 def sha256(data: Union[str, bytes, dict]) -> str:
     """Quick SHA-256 hash"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if isinstance(data, (bytes, bytearray)):
+        # Direct hashlib call; skips registry lookup and type dispatch
+        return _CONSTRUCTORS['sha256'](data).hexdigest()
     return SHAInfinity.hash(data, 'sha256')
 
 
 def sha512(data: Union[str, bytes, dict]) -> str:
     """Quick SHA-512 hash"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if isinstance(data, (bytes, bytearray)):
+        return SHAInfinity.hash_bytes(data, 'sha512')
     return SHAInfinity.hash(data, 'sha512')
 
 
 def blake2b(data: Union[str, bytes, dict]) -> str:
     """Quick BLAKE2b hash"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if isinstance(data, (bytes, bytearray)):
+        return _CONSTRUCTORS['blake2b'](data).hexdigest()
     return SHAInfinity.hash(data, 'blake2b')
 
 
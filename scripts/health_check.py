@@ -4,15 +4,20 @@ BlackRoad Endpoint Health Check System
 Validates all configured endpoints and APIs
 """
 
+import io
 import os
+import re
 import sys
+import asyncio
 import json
 import time
 import socket
+import logging
 import argparse
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
 
 # Add lib to path
@@ -20,24 +25,71 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'lib'))
 sys.path.insert(0, str(Path(__file__).parent.parent / 'integrations' / 'apis'))
 
 try:
-    from hash import BlackRoadHasher, sha256
+    from hash import BlackRoadHasher, sha256, _canonical_json
 except ImportError:
     BlackRoadHasher = None
     sha256 = lambda x: "hash-unavailable"
+    _canonical_json = lambda x: b""
 
 try:
-    from base import APIRegistry, HealthCheckResult
+    from base import APIRegistry, HealthCheckResult, _AsyncTransport
 except ImportError:
     APIRegistry = None
     HealthCheckResult = None
+    _AsyncTransport = None
 
 try:
     import yaml
 except ImportError:
     yaml = None
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Diagnostics go to stderr so --json output stays machine-readable
+logger = logging.getLogger(__name__)
+
 
-@dataclass
+def _json_default(obj: Any) -> Any:
+    """Stdlib json fallback for the types msgspec/orjson encode natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _encode_json(obj: Any, indent: bool = False) -> bytes:
+    """
+    Encode a report dataclass (or plain data) to JSON bytes
+
+    Prefers msgspec, then orjson; both encode dataclasses and datetimes
+    natively without an asdict() copy. Indented output has sorted keys.
+    """
+    if msgspec is not None:
+        if indent:
+            data = msgspec.json.encode(obj, order='sorted')
+            return msgspec.json.format(data, indent=2)
+        return msgspec.json.encode(obj)
+    if orjson is not None:
+        if not indent:
+            return orjson.dumps(obj)
+        # OPT_SORT_KEYS does not reorder dataclass fields
+        if hasattr(obj, 'to_dict'):
+            obj = obj.to_dict()
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=indent,
+                      default=_json_default).encode('utf-8')
+
+
+@dataclass(slots=True)
 class EndpointCheck:
     """Result of an endpoint check"""
     name: str
@@ -49,12 +101,28 @@ class EndpointCheck:
     error: Optional[str] = None
     timestamp: str = None
 
+    # Shared run timestamp, set by run_all_checks_async for its batch
+    _default_ts: ClassVar[Optional[str]] = None
+
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.utcnow().isoformat()
-
-
-@dataclass
+            self.timestamp = (EndpointCheck._default_ts
+                              or datetime.now(timezone.utc).isoformat())
+
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'type': self.type,
+            'endpoint': self.endpoint,
+            'healthy': self.healthy,
+            'status_code': self.status_code,
+            'latency_ms': self.latency_ms,
+            'error': self.error,
+            'timestamp': self.timestamp
+        }
+
+
+@dataclass(slots=True)
 class HealthReport:
     """Complete health check report"""
     timestamp: str
@@ -67,7 +135,39 @@ class HealthReport:
 
     def __post_init__(self):
         if not self.report_hash:
-            self.report_hash = sha256(json.dumps(asdict(self), default=str))[:16]
+            # Canonical encoding, so the hash does not depend on which JSON
+            # encoder is installed
+            data = self.to_dict()
+            del data['report_hash']
+            self.report_hash = sha256(_canonical_json(data))[:16]
+
+    def to_dict(self) -> dict:
+        return {
+            'timestamp': self.timestamp,
+            'total_checks': self.total_checks,
+            'healthy_count': self.healthy_count,
+            'unhealthy_count': self.unhealthy_count,
+            'checks': [c.to_dict() for c in self.checks],
+            'config_hash': self.config_hash,
+            'report_hash': self.report_hash
+        }
+
+
+# ${VAR} / ${VAR:-default} placeholders in endpoints.yaml
+_ENV_RE = re.compile(r'\$\{([^:}]+)(?::-([^}]*))?\}')
+
+
+def _expand_env(value: Any) -> Any:
+    """Recursively resolve ${VAR:-default} placeholders in config values"""
+    if isinstance(value, str):
+        if '${' not in value:
+            return value
+        return _ENV_RE.sub(lambda m: os.environ.get(m[1], m[2] or ''), value)
+    if isinstance(value, dict):
+        return {k: _expand_env(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_expand_env(v) for v in value]
+    return value
 
 
 class HealthChecker:
@@ -79,6 +179,21 @@ class HealthChecker:
         self.config_path = config_path or self._find_config()
         self.config = self._load_config()
         self.results: List[EndpointCheck] = []
+        self._http = self._create_http_session()
+
+    @staticmethod
+    def _create_http_session():
+        """Create a keep-alive session shared by all HTTP checks"""
+        try:
+            import requests
+            from requests.adapters import HTTPAdapter
+        except ImportError:
+            return None
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
 
     def _find_config(self) -> str:
         """Find endpoints.yaml configuration"""
@@ -95,15 +210,15 @@ class HealthChecker:
     def _load_config(self) -> Dict[str, Any]:
         """Load endpoint configuration"""
         if not Path(self.config_path).exists():
-            print(f"Warning: Config not found at {self.config_path}")
+            logger.warning(f"Config not found at {self.config_path}")
             return {}
 
         if yaml is None:
-            print("Warning: PyYAML not installed, using empty config")
+            logger.warning("PyYAML not installed, using empty config")
             return {}
 
         with open(self.config_path) as f:
-            return yaml.safe_load(f) or {}
+            return _expand_env(yaml.safe_load(f) or {})
 
     def check_tcp_port(self, host: str, port: int, timeout: int = 5) -> bool:
         """Check if a TCP port is open"""
@@ -116,11 +231,25 @@ class HealthChecker:
         except Exception:
             return False
 
+    @staticmethod
+    async def _tcp_probe(host: str, port: int, timeout: int = 5) -> bool:
+        """Check if a TCP port is open without blocking a thread"""
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port), timeout
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
+
     def check_http_endpoint(self, url: str, timeout: int = 10) -> EndpointCheck:
         """Check an HTTP endpoint"""
-        try:
-            import requests
-        except ImportError:
+        if self._http is None:
             return EndpointCheck(
                 name="http",
                 type="http",
@@ -131,7 +260,7 @@ class HealthChecker:
 
         start = time.time()
         try:
-            response = requests.get(url, timeout=timeout)
+            response = self._http.get(url, timeout=timeout)
             latency = (time.time() - start) * 1000
             return EndpointCheck(
                 name=url,
@@ -155,8 +284,18 @@ class HealthChecker:
         """Check SSH connectivity"""
         start = time.time()
         is_open = self.check_tcp_port(host, port)
-        latency = (time.time() - start) * 1000
+        return self._ssh_check(host, port, is_open, start)
 
+    async def acheck_ssh_host(self, host: str, port: int = 22) -> EndpointCheck:
+        """Async variant of check_ssh_host"""
+        start = time.time()
+        is_open = await self._tcp_probe(host, port)
+        return self._ssh_check(host, port, is_open, start)
+
+    @staticmethod
+    def _ssh_check(host: str, port: int, is_open: bool,
+                   start: float) -> EndpointCheck:
+        latency = (time.time() - start) * 1000
         return EndpointCheck(
             name=f"ssh://{host}:{port}",
             type="ssh",
@@ -166,10 +305,15 @@ class HealthChecker:
             error=None if is_open else "Port closed or unreachable"
         )
 
+    def _run_parallel(self, probes: List[Tuple[Callable, tuple]]) -> List[Any]:
+        """Run I/O-bound probes concurrently, returning results in order"""
+        if not probes:
+            return []
+        with ThreadPoolExecutor(max_workers=min(32, len(probes))) as executor:
+            return list(executor.map(lambda p: p[0](*p[1]), probes))
+
     def check_api_endpoints(self) -> List[EndpointCheck]:
         """Check all API endpoints using the API registry"""
-        results = []
-
         if APIRegistry is None:
             return [EndpointCheck(
                 name="api_registry",
@@ -179,7 +323,18 @@ class HealthChecker:
                 error="API registry not available"
             )]
 
-        api_results = APIRegistry.health_check_all()
+        return self._api_checks(APIRegistry.health_check_all())
+
+    async def acheck_api_endpoints(self) -> List[EndpointCheck]:
+        """Async variant of check_api_endpoints"""
+        if APIRegistry is None:
+            return self.check_api_endpoints()
+        return self._api_checks(await APIRegistry.ahealth_check_all())
+
+    @staticmethod
+    def _api_checks(api_results: Dict[str, Any]) -> List[EndpointCheck]:
+        """Convert registry health results to endpoint checks"""
+        results = []
         for name, result in api_results.items():
             results.append(EndpointCheck(
                 name=name,
@@ -195,62 +350,99 @@ class HealthChecker:
 
     def check_pi_cluster(self) -> List[EndpointCheck]:
         """Check Raspberry Pi cluster connectivity"""
-        results = []
+        cluster = self._pi_cluster()
+        return self._run_parallel([(self._check_pi, (pi,)) for pi in cluster])
 
+    async def acheck_pi_cluster(self) -> List[EndpointCheck]:
+        """Probe all Pi cluster nodes concurrently on the event loop"""
+        return list(await asyncio.gather(
+            *[self._acheck_pi(pi) for pi in self._pi_cluster()]
+        ))
+
+    def _pi_cluster(self) -> List[Dict[str, Any]]:
         hardware = self.config.get('hardware', {})
         pi_config = hardware.get('raspberry_pi', {})
-        cluster = pi_config.get('endpoints', {}).get('cluster', [])
-
-        for pi in cluster:
-            host = pi.get('host', '').replace('${', '').split(':-')[-1].rstrip('}')
-            port = pi.get('port', 22)
-            name = pi.get('name', host)
-
-            result = self.check_ssh_host(host, port)
-            result.name = f"pi:{name}"
-            results.append(result)
-
-        return results
+        return pi_config.get('endpoints', {}).get('cluster', [])
+
+    def _check_pi(self, pi: Dict[str, Any]) -> EndpointCheck:
+        """Check a single Pi cluster node"""
+        host = pi.get('host', '')
+        result = self.check_ssh_host(host, pi.get('port', 22))
+        result.name = f"pi:{pi.get('name', host)}"
+        return result
+
+    async def _acheck_pi(self, pi: Dict[str, Any]) -> EndpointCheck:
+        """Async variant of _check_pi"""
+        host = pi.get('host', '')
+        result = await self.acheck_ssh_host(host, pi.get('port', 22))
+        result.name = f"pi:{pi.get('name', host)}"
+        return result
 
     def check_cloud_services(self) -> List[EndpointCheck]:
         """Check cloud service endpoints"""
-        results = []
-
         cloud = self.config.get('cloud', {})
 
+        probes = []
         for service_name, service_config in cloud.items():
             health_check = service_config.get('health_check', {})
             base_url = service_config.get('endpoints', {}).get('api', '')
 
             if base_url and health_check.get('endpoint'):
                 full_url = f"{base_url.rstrip('/')}{health_check['endpoint']}"
-                result = self.check_http_endpoint(full_url)
-                result.name = service_name
-                result.type = "cloud"
-                results.append(result)
-
-        return results
-
-    def run_all_checks(self) -> HealthReport:
-        """Run all health checks and generate report"""
-        print("Running BlackRoad Health Checks...")
-        print("=" * 50)
+                probes.append((self._check_cloud_service, (service_name, full_url)))
 
-        all_results = []
+        return self._run_parallel(probes)
 
-        # API endpoints
-        print("\nChecking API endpoints...")
-        api_results = self.check_api_endpoints()
-        all_results.extend(api_results)
-        for r in api_results:
-            self._print_result(r)
+    def _check_cloud_service(self, service_name: str, url: str) -> EndpointCheck:
+        """Check a single cloud service endpoint"""
+        result = self.check_http_endpoint(url)
+        result.name = service_name
+        result.type = "cloud"
+        return result
 
-        # Pi cluster
-        print("\nChecking Pi cluster...")
-        pi_results = self.check_pi_cluster()
-        all_results.extend(pi_results)
-        for r in pi_results:
-            self._print_result(r)
+    def run_all_checks(self, quiet: bool = False) -> HealthReport:
+        """Run all health checks and generate report"""
+        async def _run():
+            try:
+                return await self.run_all_checks_async(quiet)
+            finally:
+                # The shared aiohttp session is bound to this loop; close it
+                # before asyncio.run tears the loop down
+                if _AsyncTransport is not None:
+                    await _AsyncTransport.close()
+        return asyncio.run(_run())
+
+    async def run_all_checks_async(self, quiet: bool = False) -> HealthReport:
+        """Run all health checks on one event loop and generate report"""
+        if not quiet:
+            print("Running BlackRoad Health Checks...")
+            print("=" * 50)
+
+        # One timestamp for the whole batch instead of one per check
+        now_iso = datetime.now(timezone.utc).isoformat()
+        EndpointCheck._default_ts = now_iso
+
+        # API requests and Pi TCP probes share one loop; total wall time is
+        # bounded by the slowest probe rather than the sum of all of them
+        try:
+            api_results, pi_results = await asyncio.gather(
+                self.acheck_api_endpoints(),
+                self.acheck_pi_cluster(),
+            )
+        finally:
+            EndpointCheck._default_ts = None
+        all_results = api_results + pi_results
+
+        if not quiet:
+            # Buffer per-check lines and emit them in a single write
+            buf = io.StringIO()
+            buf.write("\nChecking API endpoints...\n")
+            for r in api_results:
+                buf.write(self._format_result(r))
+            buf.write("\nChecking Pi cluster...\n")
+            for r in pi_results:
+                buf.write(self._format_result(r))
+            sys.stdout.write(buf.getvalue())
 
         # Calculate config hash
         config_hash = "no-config"
@@ -261,7 +453,7 @@ class HealthChecker:
         healthy_count = sum(1 for r in all_results if r.healthy)
 
         report = HealthReport(
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=now_iso,
             total_checks=len(all_results),
             healthy_count=healthy_count,
             unhealthy_count=len(all_results) - healthy_count,
@@ -269,48 +461,51 @@ class HealthChecker:
             config_hash=config_hash
         )
 
-        self._print_summary(report)
+        if not quiet:
+            self._print_summary(report)
 
         return report
 
-    def _print_result(self, result: EndpointCheck) -> None:
-        """Print a single check result"""
+    @staticmethod
+    def _format_result(result: EndpointCheck) -> str:
+        """Format a single check result as one output line"""
         status = "✓" if result.healthy else "✗"
-        latency = f"{result.latency_ms:.0f}ms" if result.latency_ms else "N/A"
-
-        print(f"  {status} {result.name}: ", end="")
         if result.healthy:
-            print(f"healthy ({latency})")
-        else:
-            error = result.error[:40] if result.error else "unknown error"
-            print(f"unhealthy - {error}")
+            latency = f"{result.latency_ms:.0f}ms" if result.latency_ms else "N/A"
+            return f"  {status} {result.name}: healthy ({latency})\n"
+        error = result.error[:40] if result.error else "unknown error"
+        return f"  {status} {result.name}: unhealthy - {error}\n"
 
     def _print_summary(self, report: HealthReport) -> None:
         """Print health check summary"""
-        print("\n" + "=" * 50)
-        print("HEALTH CHECK SUMMARY")
-        print("=" * 50)
-        print(f"Timestamp: {report.timestamp}")
-        print(f"Config Hash: {report.config_hash}")
-        print(f"Report Hash: {report.report_hash}")
-        print(f"\nTotal Checks: {report.total_checks}")
-        print(f"  Healthy: {report.healthy_count}")
-        print(f"  Unhealthy: {report.unhealthy_count}")
+        lines = [
+            "",
+            "=" * 50,
+            "HEALTH CHECK SUMMARY",
+            "=" * 50,
+            f"Timestamp: {report.timestamp}",
+            f"Config Hash: {report.config_hash}",
+            f"Report Hash: {report.report_hash}",
+            f"\nTotal Checks: {report.total_checks}",
+            f"  Healthy: {report.healthy_count}",
+            f"  Unhealthy: {report.unhealthy_count}",
+        ]
 
         if report.unhealthy_count > 0:
-            print("\nUnhealthy Endpoints:")
-            for check in report.checks:
-                if not check.healthy:
-                    print(f"  - {check.name}: {check.error}")
+            lines.append("\nUnhealthy Endpoints:")
+            lines.extend(f"  - {check.name}: {check.error}"
+                         for check in report.checks if not check.healthy)
 
         overall = "HEALTHY" if report.unhealthy_count == 0 else "DEGRADED"
-        print(f"\nOverall Status: {overall}")
+        lines.append(f"\nOverall Status: {overall}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def export_report(self, report: HealthReport, filepath: str) -> None:
         """Export report to JSON file"""
-        with open(filepath, 'w') as f:
-            json.dump(asdict(report), f, indent=2, default=str)
-        print(f"\nReport exported to: {filepath}")
+        # Encode once and emit a single write
+        with open(filepath, 'wb') as f:
+            f.write(_encode_json(report, indent=True))
+        logger.info(f"Report exported to: {filepath}")
 
 
 def main():
@@ -320,14 +515,17 @@ def main():
     parser.add_argument('--json', action='store_true', help='Output as JSON')
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO)
+
     checker = HealthChecker(config_path=args.config)
-    report = checker.run_all_checks()
+    # In JSON mode the report is the only stdout output
+    report = checker.run_all_checks(quiet=args.json)
 
     if args.output:
         checker.export_report(report, args.output)
 
     if args.json:
-        print(json.dumps(asdict(report), indent=2, default=str))
+        sys.stdout.buffer.write(_encode_json(report, indent=True) + b"\n")
 
     # Exit with error code if any unhealthy
     sys.exit(0 if report.unhealthy_count == 0 else 1)
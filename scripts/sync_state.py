@@ -7,9 +7,13 @@ Syncs kanban state between Git, Cloudflare KV, and Salesforce
 import os
 import sys
 import json
+import asyncio
+import hashlib
+import logging
+import functools
 import argparse
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
@@ -18,16 +22,86 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'lib'))
 sys.path.insert(0, str(Path(__file__).parent.parent / 'integrations' / 'apis'))
 
 try:
-    from hash import BlackRoadHasher, sha256
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from hash import BlackRoadHasher
 except ImportError:
     BlackRoadHasher = None
-    sha256 = lambda x: "unavailable"
 
 try:
-    from base import CloudflareAPI, SalesforceAPI, APIResponse
+    from base import CloudflareAPI, SalesforceAPI, APIResponse, _AsyncTransport
 except ImportError:
     CloudflareAPI = None
     SalesforceAPI = None
+    _AsyncTransport = None
+
+
+# Repository root and the git-ignored local sync state
+_REPO_ROOT = Path(__file__).parent.parent
+_SYNC_DIR = _REPO_ROOT / '.blackroad'
+# Whole-state hashes keyed by state file signature
+_HASH_CACHE_FILE = _SYNC_DIR / 'state_hashes.json'
+# Per-key hashes of the last confirmed writes, for --incremental
+_LAST_SYNC_FILE = _SYNC_DIR / 'last_sync.json'
+
+# Cloudflare KV bulk writes accept at most 10,000 pairs per request
+_KV_BULK_LIMIT = 10000
+# Upper bound on concurrent bulk requests
+_KV_MAX_IN_FLIGHT = 64
+
+
+# Short content hashes are 8-byte BLAKE2b digests (16 hex chars)
+_HASH_SCHEME = 'blake2b-64'
+
+
+@functools.lru_cache(maxsize=4096)
+def _hash_value(value_str: str) -> str:
+    """Short content hash; unchanged values hash once per process"""
+    return hashlib.blake2b(value_str.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Compact, key-sorted JSON bytes for storage and transport; orjson when installed
+
+    Output differs between encoders (datetime and float formatting), so it
+    must not be hashed; use _canonical for that.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str,
+                            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return _canonical(obj)
+
+
+def _canonical(obj: Any) -> bytes:
+    """Canonical JSON bytes for hashing, always from the stdlib encoder"""
+    return json.dumps(obj, sort_keys=True, separators=(',', ':'),
+                      ensure_ascii=False, default=str).encode('utf-8')
+
+
+def _digest_value(value: Any) -> str:
+    """Short content hash of any state value"""
+    if not isinstance(value, (dict, list)):
+        return _hash_value(str(value))
+    return hashlib.blake2b(_canonical(value), digest_size=8).hexdigest()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a YAML file, memoized on its mtime and size
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(path_str, 'rb') as f:
+        return yaml.load(f, Loader=loader) or {}
 
 
 @dataclass
@@ -41,15 +115,23 @@ class StateRecord:
 
     @classmethod
     def create(cls, key: str, value: Any, source: str = "local"):
-        value_str = json.dumps(value, sort_keys=True) if isinstance(value, (dict, list)) else str(value)
         return cls(
             key=key,
             value=value,
-            hash=sha256(value_str)[:16],
+            hash=_digest_value(value),
             timestamp=datetime.utcnow().isoformat(),
             source=source
         )
 
+    def to_dict(self) -> dict:
+        return {
+            'key': self.key,
+            'value': self.value,
+            'hash': self.hash,
+            'timestamp': self.timestamp,
+            'source': self.source
+        }
+
 
 @dataclass
 class SyncResult:
@@ -60,11 +142,23 @@ class SyncResult:
     records_synced: int
     errors: list
     timestamp: str = ""
+    skipped: int = 0
 
     def __post_init__(self):
         if not self.timestamp:
             self.timestamp = datetime.utcnow().isoformat()
 
+    def to_dict(self) -> dict:
+        return {
+            'success': self.success,
+            'source': self.source,
+            'destination': self.destination,
+            'records_synced': self.records_synced,
+            'errors': self.errors,
+            'timestamp': self.timestamp,
+            'skipped': self.skipped
+        }
+
 
 class StateSynchronizer:
     """
@@ -81,6 +175,8 @@ class StateSynchronizer:
         self.salesforce = SalesforceAPI() if SalesforceAPI else None
         self.hasher = BlackRoadHasher() if BlackRoadHasher else None
         self.namespace_id = os.getenv("CLOUDFLARE_KV_NAMESPACE_ID", "")
+        # Last loaded state, its file and its file signature, for state-hash reuse
+        self._loaded: Optional[Tuple[Dict[str, Any], str, str]] = None
 
     def load_local_state(self, state_file: str = "kanban/projects.yaml") -> Dict[str, Any]:
         """Load state from local YAML file"""
@@ -90,15 +186,81 @@ class StateSynchronizer:
             print("Warning: PyYAML not installed")
             return {}
 
-        state_path = Path(__file__).parent.parent / state_file
-        if not state_path.exists():
+        state_path = _REPO_ROOT / state_file
+        try:
+            st = state_path.stat()
+        except OSError:
             return {}
 
-        with open(state_path) as f:
-            return yaml.safe_load(f) or {}
+        state = _load_yaml_cached(str(state_path), st.st_mtime_ns, st.st_size)
+        signature = f"{self._signature_prefix(state_file)}{st.st_mtime_ns}:{st.st_size}"
+        self._loaded = (state, state_file, signature)
+        return state
+
+    @staticmethod
+    def _signature_prefix(state_file: str) -> str:
+        """Cache-key prefix shared by every version of one state file"""
+        return f"{_HASH_SCHEME}:{state_file}:"
+
+    def _state_hash(self, state: Dict[str, Any], persist: bool = False) -> str:
+        """
+        Canonical hash of the whole state
+
+        For state returned by load_local_state the hash is looked up in an
+        on-disk cache keyed by the source file's mtime and size, so unchanged
+        state files are not re-serialized. New hashes are only written back
+        when persist is set (sync runs), one entry per state file.
+        """
+        if self._loaded is None or self._loaded[0] is not state:
+            return _digest_value(state)
+        _, state_file, signature = self._loaded
 
-    def sync_to_cloudflare(self, state: Dict[str, Any], prefix: str = "blackroad") -> SyncResult:
+        try:
+            cache = json.loads(_HASH_CACHE_FILE.read_text())
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+        if signature in cache:
+            return cache[signature]
+
+        state_hash = _digest_value(state)
+
+        if persist:
+            # Replace older versions of this state file, keep other files
+            prefix = self._signature_prefix(state_file)
+            cache = {k: v for k, v in cache.items() if not k.startswith(prefix)}
+            cache[signature] = state_hash
+            try:
+                _SYNC_DIR.mkdir(parents=True, exist_ok=True)
+                _HASH_CACHE_FILE.write_text(json.dumps(cache))
+            except OSError:
+                pass
+        return state_hash
+
+    def sync_to_cloudflare(self, state: Dict[str, Any], prefix: str = "blackroad",
+                           known: Optional[Dict[str, str]] = None) -> SyncResult:
         """Sync state to Cloudflare KV"""
+        async def _run():
+            try:
+                return await self.sync_to_cloudflare_async(state, prefix, known)
+            finally:
+                # The shared aiohttp session is bound to this loop; close it
+                # before asyncio.run tears the loop down
+                if _AsyncTransport is not None:
+                    await _AsyncTransport.close()
+        return asyncio.run(_run())
+
+    async def sync_to_cloudflare_async(self, state: Dict[str, Any],
+                                       prefix: str = "blackroad",
+                                       known: Optional[Dict[str, str]] = None) -> SyncResult:
+        """
+        Sync state to Cloudflare KV using concurrent bulk writes
+
+        If known (key -> hash of the last confirmed write) is given, keys
+        whose hash is unchanged are skipped, and known is updated in place
+        to reflect this run.
+        """
         if not self.cloudflare or not self.namespace_id:
             return SyncResult(
                 success=False,
@@ -108,29 +270,74 @@ class StateSynchronizer:
                 errors=["Cloudflare not configured"]
             )
 
-        errors = []
-        synced = 0
-
-        for key, value in self._flatten_state(state, prefix).items():
+        keys, values = self._flatten_state(state, prefix)
+        entries = []
+        hashes = {}
+        for key, value in zip(keys, values):
             record = StateRecord.create(key, value, "local")
-            kv_value = json.dumps(asdict(record))
+            if known is not None and known.get(key) == record.hash:
+                continue
+            hashes[key] = record.hash
+            entries.append({'key': key, 'value': _dumps(record.to_dict()).decode('utf-8')})
 
-            response = self.cloudflare.kv_put(self.namespace_id, key, kv_value)
-            if response.success:
-                synced += 1
-            else:
-                errors.append(f"{key}: {response.error}")
+        batches = [entries[i:i + _KV_BULK_LIMIT]
+                   for i in range(0, len(entries), _KV_BULK_LIMIT)]
+        semaphore = asyncio.Semaphore(_KV_MAX_IN_FLIGHT)
+
+        async def _put(batch):
+            async with semaphore:
+                return await self.cloudflare.akv_bulk_put(self.namespace_id, batch)
+
+        # 429s are retried with backoff inside the API client
+        responses = await asyncio.gather(*[_put(b) for b in batches])
+
+        errors = []
+        synced = 0
+        written = {}
+        for batch, response in zip(batches, responses):
+            if not response.success:
+                first, last = batch[0]['key'], batch[-1]['key']
+                errors.append(f"{first}..{last}: {response.error}")
+                continue
+            result = response.data.get('result') if isinstance(response.data, dict) else None
+            failed = (result or {}).get('unsuccessful_keys') or []
+            synced += len(batch) - len(failed)
+            errors.extend(f"{key}: bulk write rejected" for key in failed)
+            rejected = set(failed)
+            written.update((e['key'], hashes[e['key']]) for e in batch
+                           if e['key'] not in rejected)
+
+        if known is not None:
+            self._update_known(known, keys, written)
 
         return SyncResult(
             success=len(errors) == 0,
             source="local",
             destination="cloudflare",
             records_synced=synced,
-            errors=errors
+            errors=errors,
+            skipped=len(keys) - len(entries)
         )
 
-    def sync_to_salesforce(self, state: Dict[str, Any]) -> SyncResult:
-        """Sync state to Salesforce custom objects"""
+    @staticmethod
+    def _update_known(known: Dict[str, str], current_keys: List[str],
+                      written: Dict[str, str]) -> None:
+        """Record confirmed writes and forget keys no longer in the state"""
+        current = set(current_keys)
+        for key in [k for k in known if k not in current]:
+            del known[key]
+        known.update(written)
+
+    def sync_to_salesforce(self, state: Dict[str, Any],
+                           known: Optional[Dict[str, str]] = None) -> SyncResult:
+        """
+        Sync state to Salesforce custom objects
+
+        If known (board id -> Hash_ID__c of the last confirmed upsert) is
+        given, unchanged boards are skipped; boards missing from it are
+        checked against Salesforce with one SOQL query per batch. known is
+        updated in place to reflect this run.
+        """
         if not self.salesforce:
             return SyncResult(
                 success=False,
@@ -153,35 +360,82 @@ class StateSynchronizer:
         errors = []
         synced = 0
 
-        # Sync boards as projects
+        # Sync boards as projects; upserting on External_ID__c makes
+        # re-syncs idempotent updates instead of duplicate-insert errors
         boards = state.get('boards', {})
-        for board_id, board_data in boards.items():
-            sf_record = {
+        records = [
+            {
                 'Name': board_data.get('name', board_id),
                 'External_ID__c': board_id,
                 'Description__c': board_data.get('description', ''),
                 'Status__c': 'Active',
-                'Hash_ID__c': sha256(json.dumps(board_data))[:16]
+                'Hash_ID__c': _digest_value(board_data)
             }
-
-            response = self.salesforce.post(
-                '/sobjects/BlackRoad_Project__c',
-                data=sf_record
+            for board_id, board_data in boards.items()
+        ]
+
+        limit = self.salesforce.COLLECTION_LIMIT
+        total = len(records)
+        written = {}
+        if known is not None:
+            unknown = [r['External_ID__c'] for r in records if r['External_ID__c'] not in known]
+            remote = self._salesforce_hashes(unknown)
+            records = [r for r in records
+                       if known.get(r['External_ID__c'], remote.get(r['External_ID__c']))
+                       != r['Hash_ID__c']]
+            # Boards already current in Salesforce count as confirmed
+            written.update((board_id, h) for board_id, h in remote.items()
+                           if h is not None)
+
+        for i in range(0, len(records), limit):
+            batch = records[i:i + limit]
+            response = self.salesforce.upsert_collection(
+                'BlackRoad_Project__c', 'External_ID__c', batch
             )
+            if not response.success or not isinstance(response.data, list):
+                errors.extend(f"Board {r['External_ID__c']}: {response.error}" for r in batch)
+                continue
 
-            if response.success or response.status_code == 400:  # 400 might be duplicate
-                synced += 1
-            else:
-                errors.append(f"Board {board_id}: {response.error}")
+            for record, outcome in zip(batch, response.data):
+                if outcome.get('success'):
+                    synced += 1
+                    written[record['External_ID__c']] = record['Hash_ID__c']
+                else:
+                    messages = '; '.join(e.get('message', '') for e in outcome.get('errors', []))
+                    errors.append(f"Board {record['External_ID__c']}: {messages}")
+
+        if known is not None:
+            self._update_known(known, list(boards), written)
 
         return SyncResult(
             success=len(errors) == 0,
             source="local",
             destination="salesforce",
             records_synced=synced,
-            errors=errors
+            errors=errors,
+            skipped=total - len(records)
         )
 
+    def _salesforce_hashes(self, board_ids: List[str]) -> Dict[str, Optional[str]]:
+        """Current Hash_ID__c per External_ID__c, batched into SOQL IN queries"""
+        hashes: Dict[str, Optional[str]] = {}
+        limit = self.salesforce.COLLECTION_LIMIT
+        for i in range(0, len(board_ids), limit):
+            quoted = ', '.join(
+                "'" + str(b).replace('\\', '\\\\').replace("'", "\\'") + "'"
+                for b in board_ids[i:i + limit]
+            )
+            response = self.salesforce.get('/query', params={
+                'q': "SELECT External_ID__c, Hash_ID__c FROM BlackRoad_Project__c "
+                     f"WHERE External_ID__c IN ({quoted})"
+            })
+            if not response.success or not isinstance(response.data, dict):
+                # Unknown remote state: those boards are simply re-upserted
+                continue
+            for row in response.data.get('records', []):
+                hashes[row.get('External_ID__c')] = row.get('Hash_ID__c')
+        return hashes
+
     def sync_from_cloudflare(self, prefix: str = "blackroad") -> Dict[str, Any]:
         """Fetch state from Cloudflare KV"""
         if not self.cloudflare or not self.namespace_id:
@@ -191,36 +445,84 @@ class StateSynchronizer:
         # Simplified implementation
         return {}
 
-    def _flatten_state(self, state: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
-        """Flatten nested state dict for KV storage"""
-        result = {}
-
-        def _flatten(obj, current_key):
+    def _flatten_state(self, state: Dict[str, Any],
+                       prefix: str = "") -> Tuple[List[str], List[Any]]:
+        """Flatten nested state dict for KV storage into parallel key/value lists"""
+        # Insertion-ordered like the original recursive version, so colliding
+        # keys keep their first position and last value
+        result: Dict[Any, Any] = {}
+        # Paths are tuples of raw key parts, joined only at leaves, so
+        # interior levels never build intermediate key strings
+        stack = [((prefix,), state)]
+
+        while stack:
+            path, obj = stack.pop()
             if isinstance(obj, dict):
-                for k, v in obj.items():
-                    new_key = f"{current_key}:{k}" if current_key else k
-                    _flatten(v, new_key)
+                # Push in reverse so leaves come out in document order
+                stack.extend((path + (k,), v) for k, v in reversed(obj.items()))
             else:
-                result[current_key] = obj
-
-        _flatten(state, prefix)
-        return result
-
-    def generate_sync_manifest(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate a manifest of what would be synced"""
-        flattened = self._flatten_state(state, "blackroad")
+                result[self._join_key(path)] = obj
+
+        return list(result), list(result.values())
+
+    @staticmethod
+    def _join_key(path: Tuple[Any, ...]) -> Any:
+        """
+        Leaf key for a path of (prefix, key, ...)
+
+        Same result as folding `f"{key}:{k}" if key else k` down the path:
+        leading falsy parts are dropped, and a lone part is kept as-is.
+        """
+        for i, part in enumerate(path):
+            if part:
+                if i == len(path) - 1:
+                    return part
+                return ':'.join(map(str, path[i:]))
+        return path[-1]
+
+    def generate_sync_manifest(self, state: Dict[str, Any],
+                               persist: bool = False) -> Dict[str, Any]:
+        """
+        Generate a manifest of what would be synced
+
+        persist lets the state hash be written to the local cache; the
+        read-only --manifest command leaves it unset.
+        """
+        keys, _ = self._flatten_state(state, "blackroad")
 
         manifest = {
             'timestamp': datetime.utcnow().isoformat(),
-            'total_keys': len(flattened),
-            'keys': list(flattened.keys()),
-            'state_hash': sha256(json.dumps(state, sort_keys=True))[:16]
+            'total_keys': len(keys),
+            'keys': keys,
+            'state_hash': self._state_hash(state, persist)
         }
 
         return manifest
 
-    def full_sync(self, force: bool = False) -> Dict[str, SyncResult]:
-        """Perform full state synchronization"""
+    def load_last_sync(self) -> Dict[str, Any]:
+        """Hashes recorded by the last sync run (empty if none)"""
+        try:
+            last = json.loads(_LAST_SYNC_FILE.read_text())
+        except (OSError, ValueError):
+            return {}
+        return last if isinstance(last, dict) else {}
+
+    def save_last_sync(self, last: Dict[str, Any]) -> None:
+        """Persist per-destination hashes for the next incremental run"""
+        try:
+            _LAST_SYNC_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _LAST_SYNC_FILE.write_bytes(_dumps(last))
+        except OSError as e:
+            print(f"Warning: could not save {_LAST_SYNC_FILE}: {e}")
+
+    def full_sync(self, force: bool = False,
+                  incremental: bool = False) -> Dict[str, SyncResult]:
+        """
+        Perform full state synchronization
+
+        With incremental, keys and boards unchanged since the last recorded
+        sync are skipped. force writes everything and discards the record.
+        """
         print("BlackRoad State Sync")
         print("=" * 50)
 
@@ -229,25 +531,41 @@ class StateSynchronizer:
             print("No local state found")
             return {}
 
-        manifest = self.generate_sync_manifest(state)
+        manifest = self.generate_sync_manifest(state, persist=True)
         print(f"State Hash: {manifest['state_hash']}")
         print(f"Total Keys: {manifest['total_keys']}")
         print()
 
+        if force:
+            incremental = False
+            _LAST_SYNC_FILE.unlink(missing_ok=True)
+
+        last = self.load_last_sync() if incremental else {}
+        cf_known = last.get('cloudflare') if isinstance(last.get('cloudflare'), dict) else {}
+        sf_known = last.get('salesforce') if isinstance(last.get('salesforce'), dict) else {}
+
         results = {}
 
         # Sync to Cloudflare
         print("Syncing to Cloudflare KV...")
-        cf_result = self.sync_to_cloudflare(state)
+        cf_result = self.sync_to_cloudflare(state, known=cf_known if incremental else None)
         results['cloudflare'] = cf_result
         self._print_result(cf_result)
 
         # Sync to Salesforce
         print("\nSyncing to Salesforce...")
-        sf_result = self.sync_to_salesforce(state)
+        sf_result = self.sync_to_salesforce(state, known=sf_known if incremental else None)
         results['salesforce'] = sf_result
         self._print_result(sf_result)
 
+        if incremental:
+            self.save_last_sync({
+                'timestamp': manifest['timestamp'],
+                'state_hash': manifest['state_hash'],
+                'cloudflare': cf_known,
+                'salesforce': sf_known
+            })
+
         return results
 
     def _print_result(self, result: SyncResult) -> None:
@@ -255,6 +573,8 @@ class StateSynchronizer:
         status = "✓" if result.success else "✗"
         print(f"  {status} {result.source} → {result.destination}")
         print(f"    Records synced: {result.records_synced}")
+        if result.skipped:
+            print(f"    Unchanged (skipped): {result.skipped}")
         if result.errors:
             print(f"    Errors: {len(result.errors)}")
             for err in result.errors[:3]:
@@ -264,11 +584,15 @@ class StateSynchronizer:
 def main():
     parser = argparse.ArgumentParser(description='BlackRoad State Sync')
     parser.add_argument('--force', action='store_true', help='Force sync even if unchanged')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only sync keys changed since the last recorded sync')
     parser.add_argument('--manifest', action='store_true', help='Only show sync manifest')
     parser.add_argument('--cloudflare', action='store_true', help='Only sync to Cloudflare')
     parser.add_argument('--salesforce', action='store_true', help='Only sync to Salesforce')
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO)
+
     sync = StateSynchronizer()
 
     if args.manifest:
@@ -277,7 +601,7 @@ def main():
         print(json.dumps(manifest, indent=2))
         return
 
-    results = sync.full_sync(force=args.force)
+    results = sync.full_sync(force=args.force, incremental=args.incremental)
 
     # Exit with error if any sync failed
     all_success = all(r.success for r in results.values())
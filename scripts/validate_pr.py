@@ -5,18 +5,28 @@ Quality gates to prevent failed pull requests
 """
 
 import os
+import re
+import ast
 import sys
 import json
+import mmap
+import threading
 import subprocess
 import argparse
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'lib'))
 
+try:
+    import pathspec
+except ImportError:
+    pathspec = None
+
 try:
     from hash import BlackRoadHasher, sha256
 except ImportError:
@@ -32,6 +42,14 @@ class ValidationResult:
     message: str
     details: Optional[Dict] = None
 
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'passed': self.passed,
+            'message': self.message,
+            'details': self.details
+        }
+
 
 @dataclass
 class PRValidationReport:
@@ -51,6 +69,73 @@ class PRValidationReport:
             'checks': [c.name for c in self.checks]
         }))[:16]
 
+    def to_dict(self) -> dict:
+        return {
+            'timestamp': self.timestamp,
+            'branch': self.branch,
+            'commit': self.commit,
+            'all_passed': self.all_passed,
+            'checks': [c.to_dict() for c in self.checks],
+            'report_hash': self.report_hash
+        }
+
+
+# Patterns looked for by the content checks, matched against raw file bytes
+_CONFLICT_MARKERS = (b'<<<<<<<', b'=======', b'>>>>>>>')
+_DEBUG_PATTERNS = (
+    b'console.log(',
+    b'debugger;',
+    b'print("DEBUG',
+    b"print('DEBUG",
+    b'import pdb',
+    b'breakpoint()',
+    b'# TODO: remove',
+    b'// TODO: remove',
+    b'FIXME: debug'
+)
+_DEBUG_SUFFIXES = ('.py', '.js', '.ts', '.sh')
+_SECRET_PATTERNS = (
+    ('AWS Key', r'AKIA[0-9A-Z]{16}'),
+    # Only real PEM labels, so the pattern does not match its own source
+    ('Private Key', r'-----BEGIN [A-Z0-9 ]*PRIVATE KEY-----'),
+    ('API Key Pattern', r'api[_-]?key["\']?\s*[:=]\s*["\'][a-zA-Z0-9]{20,}'),
+)
+_YAML_SUFFIXES = ('.yaml', '.yml')
+
+# Pattern unions for the Python fallback scan: one regex pass per check
+_CONFLICT_RE = re.compile(b'|'.join(map(re.escape, _CONFLICT_MARKERS)))
+_DEBUG_RE = re.compile(b'|'.join(map(re.escape, _DEBUG_PATTERNS)))
+_DEBUG_RANK = {p: i for i, p in enumerate(_DEBUG_PATTERNS)}
+_SECRET_RE = re.compile(b'|'.join(
+    b'(?P<s%d>%s)' % (i, p.encode()) for i, (_, p) in enumerate(_SECRET_PATTERNS)
+))
+
+# Non-syntax files are scanned in bounded windows that overlap by enough
+# bytes to catch a match straddling two reads; files over the large-file
+# limit are left to check_no_large_files
+_SCAN_CHUNK = 256 * 1024
+_SCAN_OVERLAP = 4096
+_SCAN_MAX_SIZE = 10 * 1024 * 1024
+# YAML files at least this large are parsed from a read-only mmap; below
+# a page, plain read() is cheaper than setting up the mapping
+_YAML_MMAP_MIN_SIZE = 4096
+
+# Directories never descended into when walking a tree outside git
+_WALK_EXCLUDE_DIRS = frozenset({
+    '.git', '.hg', '.svn', 'node_modules', '.venv', 'venv', '__pycache__',
+    '.tox', '.nox', '.mypy_cache', '.pytest_cache', '.ruff_cache', 'dist', 'build',
+})
+
+
+@dataclass
+class _FileScan:
+    """Findings for one file from the single read in PRValidator._scan_repo"""
+    has_conflict: bool = False
+    debug_pattern: Optional[str] = None
+    secret: Optional[str] = None
+    yaml_error: Optional[str] = None
+    syntax_error: Optional[str] = None
+
 
 class PRValidator:
     """
@@ -63,6 +148,10 @@ class PRValidator:
     def __init__(self, repo_path: Optional[str] = None):
         self.repo_path = Path(repo_path or os.getcwd())
         self.results: List[ValidationResult] = []
+        self._scan_cache: Optional[Dict[str, _FileScan]] = None
+        # git output shared by all checks; filled once under the lock
+        self._git_cache: Dict[str, object] = {}
+        self._git_lock = threading.Lock()
 
     def run_command(self, cmd: List[str]) -> Tuple[int, str, str]:
         """Run a shell command and return (returncode, stdout, stderr)"""
@@ -82,17 +171,261 @@ class PRValidator:
 
     def get_git_info(self) -> Dict[str, str]:
         """Get current git information"""
-        info = {'branch': 'unknown', 'commit': 'unknown'}
-
-        code, stdout, _ = self.run_command(['git', 'rev-parse', '--abbrev-ref', 'HEAD'])
+        with self._git_lock:
+            info = self._git_cache.get('info')
+            if info is None:
+                info = {'branch': 'unknown', 'commit': 'unknown'}
+                # One rev-parse prints the full SHA, then the branch name
+                code, stdout, _ = self.run_command(
+                    ['git', 'rev-parse', 'HEAD', '--abbrev-ref', 'HEAD']
+                )
+                lines = stdout.split()
+                if code == 0 and len(lines) == 2:
+                    info['commit'] = lines[0][:8]
+                    info['branch'] = lines[1]
+                self._git_cache['info'] = info
+
+        return dict(info)
+
+    def _ls_files(self, suffixes: Tuple[str, ...] = ()) -> Optional[FrozenSet[str]]:
+        """
+        Tracked paths from a single `git ls-files` run (None if it failed)
+
+        A frozenset for O(1) membership tests; sort it where output order matters.
+        With suffixes, only paths ending in one of them are returned.
+        """
+        with self._git_lock:
+            if 'ls-files' not in self._git_cache:
+                code, stdout, _ = self.run_command(['git', 'ls-files'])
+                self._git_cache['ls-files'] = (
+                    frozenset(stdout.splitlines()) - {''} if code == 0 else None
+                )
+            files = self._git_cache['ls-files']
+            if not suffixes or files is None:
+                return files
+            key = ('ls-files', suffixes)
+            if key not in self._git_cache:
+                self._git_cache[key] = frozenset(
+                    p for p in files if PurePosixPath(p).suffix in suffixes
+                )
+            return self._git_cache[key]
+
+    def _walk_files(self, suffixes: Tuple[str, ...]) -> List[str]:
+        """
+        Files with the given suffixes when git cannot list them
+
+        Skips _WALK_EXCLUDE_DIRS without descending, and honours the
+        top-level .gitignore when pathspec is installed.
+        """
+        spec = None
+        gitignore = self.repo_path / '.gitignore'
+        if pathspec is not None and gitignore.is_file():
+            with open(gitignore) as f:
+                spec = pathspec.PathSpec.from_lines('gitwildmatch', f)
+
+        found = []
+        for root, dirs, files in os.walk(self.repo_path):
+            dirs[:] = [d for d in dirs if d not in _WALK_EXCLUDE_DIRS]
+            rel_root = Path(root).relative_to(self.repo_path).as_posix()
+            prefix = '' if rel_root == '.' else rel_root + '/'
+            if spec is not None:
+                dirs[:] = [d for d in dirs if not spec.match_file(prefix + d + '/')]
+            for name in files:
+                rel = prefix + name
+                if PurePosixPath(name).suffix in suffixes and (
+                        spec is None or not spec.match_file(rel)):
+                    found.append(rel)
+        return found
+
+    def _git_grep(self, args: List[str]) -> Optional[str]:
+        """Run `git grep` over tracked files; None if git could not search"""
+        code, stdout, _ = self.run_command(['git', 'grep', '--no-color', *args])
         if code == 0:
-            info['branch'] = stdout.strip()
+            return stdout
+        # Exit status 1 just means nothing matched
+        return '' if code == 1 else None
+
+    def _grep_contents(self) -> Optional[Dict[str, _FileScan]]:
+        """
+        Find conflict markers, debug code and secrets with `git grep`
+
+        git searches with mmap and its own worker threads, so file contents
+        never pass through Python. Returns None if any search fails.
+        """
+        marker_args = [arg for m in _CONFLICT_MARKERS for arg in ('-e', m.decode())]
+        conflicts = self._git_grep(['-l', '-z', '-F', *marker_args])
+
+        debug_args = [arg for p in _DEBUG_PATTERNS for arg in ('-e', p.decode())]
+        # -I: with -o, binary hits print "Binary file X matches" with no NUL
+        debug = self._git_grep(['-o', '-I', '-z', '-F', *debug_args, '--',
+                                *(f'*{suffix}' for suffix in _DEBUG_SUFFIXES)])
+
+        secret_args = [arg for _, p in _SECRET_PATTERNS for arg in ('-e', p)]
+        secrets = self._git_grep(['-o', '-I', '-z', '-P', *secret_args])
+
+        if conflicts is None or debug is None or secrets is None:
+            return None
+
+        found: Dict[str, _FileScan] = {}
+        for path in filter(None, conflicts.split('\0')):
+            found.setdefault(path, _FileScan()).has_conflict = True
+
+        # Report the first pattern in list order, as the Python scan does
+        rank = {p.decode(): i for i, p in enumerate(_DEBUG_PATTERNS)}
+        for line in debug.splitlines():
+            path, sep, match = line.partition('\0')
+            if not sep:
+                continue
+            scan = found.setdefault(path, _FileScan())
+            if match in rank and (scan.debug_pattern is None
+                                  or rank[match] < rank[scan.debug_pattern]):
+                scan.debug_pattern = match
+
+        # Name the rule behind each file's first match, as the Python scan does
+        for line in secrets.splitlines():
+            path, sep, match = line.partition('\0')
+            if not sep:
+                continue
+            scan = found.setdefault(path, _FileScan())
+            if scan.secret is None:
+                named = _SECRET_RE.match(match.encode('utf-8', 'surrogateescape'))
+                scan.secret = (_SECRET_PATTERNS[int(named.lastgroup[1:])][0]
+                               if named else 'pattern match')
+
+        return found
+
+    def _scan_repo(self) -> Dict[str, _FileScan]:
+        """
+        Run all content checks over tracked files, reading each at most once
+
+        Conflict/debug/secret searches go through `git grep` when possible,
+        leaving only YAML/Python files to be read here for syntax checks.
+        Results are cached, so each check_* method reuses the same pass.
+        Outside a git repository only Python/YAML files are scanned.
+        """
+        if self._scan_cache is not None:
+            return self._scan_cache
+
+        syntax_suffixes = _YAML_SUFFIXES + ('.py',)
+        paths = self._ls_files()
+        if paths is None:
+            paths = self._walk_files(syntax_suffixes)
+            cache = {}
+        else:
+            cache = self._grep_contents()
+            if cache is not None:
+                # Content hits came from git grep; only syntax files need reading
+                paths = self._ls_files(syntax_suffixes)
+        scan_contents = cache is None
+        if scan_contents:
+            cache = {}
 
-        code, stdout, _ = self.run_command(['git', 'rev-parse', 'HEAD'])
-        if code == 0:
-            info['commit'] = stdout.strip()[:8]
+        try:
+            import yaml
+        except ImportError:
+            yaml = None
 
-        return info
+        for rel in sorted(paths):
+            needs_syntax = PurePosixPath(rel).suffix in syntax_suffixes
+            if not scan_contents and not needs_syntax:
+                continue
+            full_path = self.repo_path / rel
+            scan = cache.get(rel) or _FileScan()
+            try:
+                if needs_syntax:
+                    self._syntax_scan(scan, full_path, yaml, scan_contents)
+                else:
+                    self._stream_contents(scan, full_path)
+            except OSError:
+                # Deleted, unreadable, or a directory (e.g. submodule)
+                continue
+            cache[rel] = scan
+
+        self._scan_cache = cache
+        return cache
+
+    @staticmethod
+    def _syntax_scan(scan: _FileScan, full_path: Path, yaml, scan_contents: bool) -> None:
+        """Read one Python/YAML file (mmap for larger YAML) and scan it"""
+        with open(full_path, 'rb') as f:
+            if (full_path.suffix in _YAML_SUFFIXES
+                    and os.fstat(f.fileno()).st_size >= _YAML_MMAP_MIN_SIZE):
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    PRValidator._scan_file(scan, full_path, mm, yaml, scan_contents)
+            else:
+                PRValidator._scan_file(scan, full_path, f.read(), yaml, scan_contents)
+
+    @staticmethod
+    def _scan_file(scan: _FileScan, full_path: Path, buf, yaml,
+                   scan_contents: bool) -> None:
+        """Run syntax checks (and, without git grep, content checks) on one file"""
+        suffix = full_path.suffix
+
+        if scan_contents:
+            PRValidator._match_contents(scan, buf, suffix)
+
+        if suffix in _YAML_SUFFIXES and yaml is not None:
+            try:
+                # Compose node graph only (libyaml when available); no
+                # Python objects are constructed for a syntax check
+                yaml.compose(buf, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+            except yaml.YAMLError as e:
+                scan.yaml_error = f"{full_path.name}: {str(e)[:50]}"
+        elif suffix == '.py':
+            try:
+                # Parse only; syntax validation needs no bytecode generation
+                ast.parse(buf, filename=str(full_path))
+            except SyntaxError as e:
+                scan.syntax_error = f"{full_path.name}:{e.lineno}"
+
+    @staticmethod
+    def _match_contents(scan: _FileScan, buf: bytes, suffix: str) -> bool:
+        """
+        Fold conflict/debug/secret matches in buf into scan
+
+        Returns True once further data cannot change any finding.
+        """
+        if not scan.has_conflict:
+            scan.has_conflict = _CONFLICT_RE.search(buf) is not None
+
+        debug_done = suffix not in _DEBUG_SUFFIXES
+        if not debug_done:
+            # Report the first pattern in list order, not the first hit
+            ranks = [_DEBUG_RANK[m.group()] for m in _DEBUG_RE.finditer(buf)]
+            if scan.debug_pattern:
+                ranks.append(_DEBUG_RANK[scan.debug_pattern.encode()])
+            if ranks:
+                scan.debug_pattern = _DEBUG_PATTERNS[min(ranks)].decode()
+            debug_done = bool(ranks) and min(ranks) == 0
+
+        if scan.secret is None:
+            match = _SECRET_RE.search(buf)
+            if match:
+                scan.secret = _SECRET_PATTERNS[int(match.lastgroup[1:])][0]
+
+        return scan.has_conflict and debug_done and scan.secret is not None
+
+    @staticmethod
+    def _stream_contents(scan: _FileScan, full_path: Path) -> None:
+        """Content-scan a file in bounded windows, stopping once settled"""
+        suffix = full_path.suffix
+        with open(full_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > _SCAN_MAX_SIZE:
+                return
+            tail = b''
+            while True:
+                chunk = f.read(_SCAN_CHUNK)
+                if not chunk:
+                    return
+                window = tail + chunk
+                if PRValidator._match_contents(scan, window, suffix):
+                    return
+                tail = window[-_SCAN_OVERLAP:]
+
+    def _scanned(self, suffixes: Tuple[str, ...]) -> List[Tuple[str, _FileScan]]:
+        """Scanned files with one of the given suffixes"""
+        return [(path, scan) for path, scan in self._scan_repo().items()
+                if PurePosixPath(path).suffix in suffixes]
 
     def check_branch_naming(self) -> ValidationResult:
         """Validate branch naming convention"""
@@ -115,29 +448,16 @@ class PRValidator:
 
     def check_no_merge_conflicts(self) -> ValidationResult:
         """Check for merge conflict markers"""
-        conflict_markers = ['<<<<<<<', '=======', '>>>>>>>']
-        files_with_conflicts = []
-
-        # Check tracked files
-        code, stdout, _ = self.run_command(['git', 'ls-files'])
-        if code != 0:
+        scan = self._scan_repo()
+        if self._ls_files() is None:
             return ValidationResult(
                 name="merge_conflicts",
                 passed=False,
                 message="Could not list git files"
             )
 
-        for filepath in stdout.strip().split('\n'):
-            if not filepath:
-                continue
-            full_path = self.repo_path / filepath
-            if full_path.exists() and full_path.is_file():
-                try:
-                    content = full_path.read_text(errors='ignore')
-                    if any(marker in content for marker in conflict_markers):
-                        files_with_conflicts.append(filepath)
-                except:
-                    pass
+        files_with_conflicts = sorted(path for path, result in scan.items()
+                                      if result.has_conflict)
 
         passed = len(files_with_conflicts) == 0
         return ValidationResult(
@@ -150,38 +470,20 @@ class PRValidator:
 
     def check_no_debug_code(self) -> ValidationResult:
         """Check for debug code that shouldn't be committed"""
-        debug_patterns = [
-            'console.log(',
-            'debugger;',
-            'print("DEBUG',
-            "print('DEBUG",
-            'import pdb',
-            'breakpoint()',
-            '# TODO: remove',
-            '// TODO: remove',
-            'FIXME: debug'
-        ]
-
-        files_with_debug = []
+        scan = self._scan_repo()
 
         code, stdout, _ = self.run_command(['git', 'diff', '--cached', '--name-only'])
-        if code != 0:
+        if code == 0:
+            targets = [p for p in stdout.split('\n') if p]
+        else:
             # Check all tracked files if no staged changes
-            code, stdout, _ = self.run_command(['git', 'ls-files'])
+            targets = sorted(self._ls_files() or ())
 
-        for filepath in stdout.strip().split('\n'):
-            if not filepath:
-                continue
-            full_path = self.repo_path / filepath
-            if full_path.exists() and full_path.suffix in ['.py', '.js', '.ts', '.sh']:
-                try:
-                    content = full_path.read_text(errors='ignore')
-                    for pattern in debug_patterns:
-                        if pattern in content:
-                            files_with_debug.append(f"{filepath} ({pattern})")
-                            break
-                except:
-                    pass
+        files_with_debug = []
+        for filepath in targets:
+            result = scan.get(filepath)
+            if result is not None and result.debug_pattern:
+                files_with_debug.append(f"{filepath} ({result.debug_pattern})")
 
         # This is a warning, not a failure (sometimes debug is intentional)
         passed = True  # Changed to warning only
@@ -218,7 +520,11 @@ class PRValidator:
                 name="config_hash",
                 passed=True,
                 message=f"Config hash integrity verified ({len(hashes)} files)",
-                details={'file_hashes': {k: v[:16] for k, v in hashes.items()}}
+                details={
+                    'file_hashes': {k: v[:16] for k, v in hashes.items()},
+                    # Aggregate of the same hashes; no file is read twice
+                    'config_digest': hasher.aggregate_digest(hashes)
+                }
             )
         except Exception as e:
             return ValidationResult(
@@ -260,15 +566,8 @@ class PRValidator:
                 message="YAML validation skipped (pyyaml not installed)"
             )
 
-        yaml_files = list(self.repo_path.rglob('*.yaml')) + list(self.repo_path.rglob('*.yml'))
-        invalid_files = []
-
-        for filepath in yaml_files:
-            try:
-                with open(filepath) as f:
-                    yaml.safe_load(f)
-            except yaml.YAMLError as e:
-                invalid_files.append(f"{filepath.name}: {str(e)[:50]}")
+        yaml_files = self._scanned(_YAML_SUFFIXES)
+        invalid_files = [scan.yaml_error for _, scan in yaml_files if scan.yaml_error]
 
         passed = len(invalid_files) == 0
         return ValidationResult(
@@ -281,15 +580,8 @@ class PRValidator:
 
     def check_python_syntax(self) -> ValidationResult:
         """Validate Python file syntax"""
-        python_files = list(self.repo_path.rglob('*.py'))
-        invalid_files = []
-
-        for filepath in python_files:
-            try:
-                with open(filepath) as f:
-                    compile(f.read(), filepath, 'exec')
-            except SyntaxError as e:
-                invalid_files.append(f"{filepath.name}:{e.lineno}")
+        python_files = self._scanned(('.py',))
+        invalid_files = [scan.syntax_error for _, scan in python_files if scan.syntax_error]
 
         passed = len(invalid_files) == 0
         return ValidationResult(
@@ -305,16 +597,10 @@ class PRValidator:
         max_size_mb = 10
         large_files = []
 
-        code, stdout, _ = self.run_command(['git', 'ls-files'])
-        if code == 0:
-            for filepath in stdout.strip().split('\n'):
-                if not filepath:
-                    continue
-                full_path = self.repo_path / filepath
-                if full_path.exists():
-                    size_mb = full_path.stat().st_size / (1024 * 1024)
-                    if size_mb > max_size_mb:
-                        large_files.append(f"{filepath} ({size_mb:.1f}MB)")
+        for filepath, size in self._tracked_sizes().items():
+            size_mb = size / (1024 * 1024)
+            if size_mb > max_size_mb:
+                large_files.append(f"{filepath} ({size_mb:.1f}MB)")
 
         passed = len(large_files) == 0
         return ValidationResult(
@@ -325,32 +611,65 @@ class PRValidator:
             details={'max_size_mb': max_size_mb, 'large_files': large_files}
         )
 
+    def _tracked_sizes(self) -> Dict[str, int]:
+        """
+        Working-tree sizes of tracked files
+
+        Blob sizes come from one `git ls-tree -r -l HEAD`; only files that
+        differ from HEAD (or every file, if there is no HEAD yet) are stat'd.
+        """
+        tracked = self._ls_files() or frozenset()
+        tree_sizes: Dict[str, int] = {}
+        changed = tracked
+
+        code, stdout, _ = self.run_command(['git', 'ls-tree', '-r', '-l', '-z', 'HEAD'])
+        if code == 0:
+            for entry in filter(None, stdout.split('\0')):
+                meta, _, path = entry.partition('\t')
+                size = meta.split()[-1]
+                if size.isdigit():
+                    tree_sizes[path] = int(size)
+            code, stdout, _ = self.run_command(['git', 'diff', '--name-only', '-z', 'HEAD'])
+            if code == 0:
+                changed = set(filter(None, stdout.split('\0')))
+
+        sizes = {}
+        for filepath in sorted(tracked):
+            if filepath in tree_sizes and filepath not in changed:
+                sizes[filepath] = tree_sizes[filepath]
+                continue
+            try:
+                sizes[filepath] = (self.repo_path / filepath).stat().st_size
+            except OSError:
+                continue
+        return sizes
+
     def check_no_secrets(self) -> ValidationResult:
         """Check for potential secrets in code"""
-        secret_patterns = [
-            ('AWS Key', r'AKIA[0-9A-Z]{16}'),
-            ('Private Key', r'-----BEGIN.*PRIVATE KEY-----'),
-            ('API Key Pattern', r'api[_-]?key["\']?\s*[:=]\s*["\'][a-zA-Z0-9]{20,}'),
-        ]
+        # Content matches are reported as warnings; the patterns are broad
+        scan = self._scan_repo()
+        secret_files = sorted(path for path, result in scan.items() if result.secret)
 
-        # Simple check - just look for .env files that shouldn't be committed
+        # Tracked .env files fail the check
         env_files = list(self.repo_path.glob('.env*'))
         committed_env = []
 
-        code, stdout, _ = self.run_command(['git', 'ls-files'])
-        if code == 0:
-            tracked = stdout.strip().split('\n')
-            for env_file in env_files:
-                if env_file.name in tracked:
-                    committed_env.append(env_file.name)
+        tracked = self._ls_files()
+        if tracked is not None:
+            committed_env = [f.name for f in env_files if f.name in tracked]
 
         passed = len(committed_env) == 0
+        if not passed:
+            message = f"Warning: .env files tracked: {', '.join(committed_env)}"
+        elif secret_files:
+            message = f"Warning: Possible secrets in {len(secret_files)} files"
+        else:
+            message = "No obvious secrets detected"
         return ValidationResult(
             name="secrets_check",
             passed=passed,
-            message="No obvious secrets detected" if passed
-                    else f"Warning: .env files tracked: {', '.join(committed_env)}",
-            details={'env_files': committed_env}
+            message=message,
+            details={'env_files': committed_env, 'secret_files': secret_files[:5]}
         )
 
     def run_all_validations(self) -> PRValidationReport:
@@ -376,12 +695,16 @@ class PRValidator:
             ('Secrets Check', self.check_no_secrets),
         ]
 
-        results = []
-        for name, check_func in checks:
-            print(f"Checking {name}...", end=" ")
-            result = check_func()
-            results.append(result)
+        # Read the tree once up front; the checks are then independent and
+        # mostly wait on subprocesses or cached data, so run them in threads
+        self._scan_repo()
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [executor.submit(check_func) for _, check_func in checks]
+            results = [future.result() for future in futures]
 
+        # Report in the declared order regardless of completion order
+        for (name, _), result in zip(checks, results):
+            print(f"Checking {name}...", end=" ")
             status = "✓ PASS" if result.passed else "✗ FAIL"
             print(f"{status}")
             if not result.passed:
@@ -436,13 +759,16 @@ def main():
     validator = PRValidator(repo_path=args.path)
     report = validator.run_all_validations()
 
+    if args.output or args.json:
+        report_json = json.dumps(report.to_dict(), indent=2, default=str)
+
     if args.output:
         with open(args.output, 'w') as f:
-            json.dump(asdict(report), f, indent=2, default=str)
+            f.write(report_json)
         print(f"\nReport exported to: {args.output}")
 
     if args.json:
-        print(json.dumps(asdict(report), indent=2, default=str))
+        print(report_json)
 
     sys.exit(0 if report.all_passed else 1)
 
@@ -0,0 +1,64 @@
+"""Tests for scripts/sync_state.py"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from sync_state import StateSynchronizer  # noqa: E402
+
+
+def _reference_flatten(state, prefix=""):
+    """The original recursive flattener, kept as the key-format reference"""
+    result = {}
+
+    def _flatten(obj, current_key):
+        if isinstance(obj, dict):
+            for k, v in obj.items():
+                new_key = f"{current_key}:{k}" if current_key else k
+                _flatten(v, new_key)
+        else:
+            result[current_key] = obj
+
+    _flatten(state, prefix)
+    return list(result), list(result.values())
+
+
+class FlattenStateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sync = StateSynchronizer.__new__(StateSynchronizer)
+
+    def assertMatchesReference(self, state, prefix=""):
+        self.assertEqual(self.sync._flatten_state(state, prefix),
+                         _reference_flatten(state, prefix))
+
+    def test_nested_with_prefix(self):
+        self.assertMatchesReference(
+            {'boards': {'main': {'name': 'Main', 'cards': [1, 2]}}, 'version': 3},
+            'blackroad')
+
+    def test_empty_prefix(self):
+        self.assertMatchesReference({'a': {'b': 1}, 'c': 2})
+
+    def test_empty_keys(self):
+        state = {'': {'a': 1, '': 2}, 'b': {'': {'': 3}}}
+        self.assertMatchesReference(state)
+        self.assertMatchesReference(state, 'blackroad')
+
+    def test_non_string_and_falsy_keys(self):
+        state = {0: {'x': 1}, 1: 2, 'n': {None: 3, 0: 4}}
+        self.assertMatchesReference(state)
+        self.assertMatchesReference(state, 'p')
+
+    def test_colliding_keys_keep_first_position_last_value(self):
+        self.assertMatchesReference({'': {'a': 1}, 'a': 2, 'z': 0})
+
+    def test_non_dict_root(self):
+        self.assertMatchesReference(5, 'blackroad')
+        self.assertMatchesReference([1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()